@@ -14,7 +14,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 try:
-    from github_analyzer import main, GitHubAnalyzer
+    from github_analyzer import main, GitHubAnalyzer, load_env_file
 except ImportError as e:
     print(f"❌ インポートエラー: {e}")
     print("💡 以下のコマンドで依存関係をインストールしてください:")
@@ -59,13 +59,7 @@ def main_wrapper():
         env_file = project_root / ".env"
         if env_file.exists():
             print("✅ .env ファイルを読み込みました")
-            # .env ファイルを手動で読み込み
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ[key.strip()] = value.strip()
+            load_env_file(str(env_file))
         
         # 環境変数の確認
         if not os.getenv('GITHUB_TOKEN'):
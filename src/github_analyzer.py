@@ -5,92 +5,1027 @@ GitHub Portfolio Analyzer for Claude Code
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+import hashlib
+import html
+import itertools
 import json
+import logging
 import os
+import shelve
+import string
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import re
 
+try:
+    import orjson  # 任意: 高速なJSONパーサ
+except ImportError:
+    orjson = None
+
+try:
+    import httpx  # 任意: HTTP/2で1本の接続に多重化
+except ImportError:
+    httpx = None
+
+# HTTPクライアントが送出する通信エラー
+HTTP_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# .envファイルの1行（KEY=VALUE）。コメント行・空行は英字で始まらないため一致しない（行をまたがないよう空白は [ \t] のみ）
+ENV_LINE_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$', re.M)
+
+
 # .envファイルの読み込み
 def load_env_file(env_path: str = '.env'):
-    """Load environment variables from .env file"""
+    """Load environment variables from .env file (existing variables take precedence)"""
     if os.path.exists(env_path):
         with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+            content = f.read()
+        # ファイル全体を1回の正規表現走査で解析し、既に設定済みの環境変数は上書きしない
+        for match in ENV_LINE_RE.finditer(content):
+            os.environ.setdefault(match.group(1), match.group(2))
+
+
+def with_percentages(items, total: int) -> List[tuple]:
+    """(名前, 件数) の列に全体に対する割合(%)を付与（スケールは一度だけ計算）"""
+    scale = 100.0 / max(total, 1)
+    return [(name, count, count * scale) for name, count in items]
+
+
+def json_loads(data):
+    """JSONを解析（orjson があれば使用）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """インデント付きのUTF-8 JSONを生成（orjson があれば使用）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def json_dumps(obj: Any) -> str:
+    """インデント付きのJSON文字列を生成（非ASCII文字はそのまま出力）"""
+    return json_dumps_bytes(obj).decode('utf-8')
+
+
+# 出力ファイルの書き込みバッファ（1MB）
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def write_output(path: str, content) -> None:
+    """レポート等の出力ファイルをバイナリモードで書き込み（文字列はUTF-8でエンコード）"""
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    with open(path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write(data)
+
+
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+
+# 技術スタック検出用ファイル（GraphQLエイリアス → ファイルパス）
+TECH_STACK_FILE_ALIASES = {
+    'pkg': 'package.json',
+    'req': 'requirements.txt',
+    'gomod': 'go.mod',
+    'cargo': 'Cargo.toml',
+    'compose': 'docker-compose.yml',
+    'dockerfile': 'Dockerfile',
+}
+TECH_STACK_FILES = frozenset(TECH_STACK_FILE_ALIASES.values())
+
+# 技術スタック検出用に読み込むファイル先頭の最大バイト数
+MAX_FILE_BYTES = 10000
+
+# 並列分析のデフォルトワーカー数とHTTPコネクションプールのサイズ
+DEFAULT_WORKERS = 16
+HTTP_POOL_SIZE = 20
+
+# レート制限の残りがこの値を下回ったらリセットまで待機する
+RATE_LIMIT_MIN_REMAINING = 50
+# 403/429（セカンダリレート制限）を受けたときの再試行回数
+RATE_LIMIT_MAX_RETRIES = 3
+# トークン1つあたりの同時リクエスト数の上限（リクエストが積み上がってセカンダリレート制限に触れないように）
+MAX_IN_FLIGHT_PER_TOKEN = 10
+
+# Linkヘッダーの rel="last" のURLからページ番号を取り出す
+LINK_LAST_PAGE_RE = re.compile(r'<[^>]*?[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# トークンプールで分散するリポジトリ単位のAPI（/user などは認証ユーザー固有なので対象外）
+GITHUB_REPOS_API_PREFIX = 'https://api.github.com/repos/'
+
+# 1クエリにまとめるリポジトリ数（GraphQLのノード数制限に余裕を持たせる）
+GRAPHQL_BATCH_SIZE = 10
+
+GRAPHQL_REPO_FIELDS = """
+    languages(first: 100, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+    defaultBranchRef { target { ... on Commit { history { totalCount } } } }
+    root: object(expression: "HEAD:") { ... on Tree { entries { name } } }
+    workflows: object(expression: "HEAD:.github/workflows") { ... on Tree { entries { name } } }
+""" + "".join(
+    f'    {alias}: object(expression: "HEAD:{path}") {{ ... on Blob {{ text }} }}\n'
+    for alias, path in TECH_STACK_FILE_ALIASES.items()
+)
+
+# viewer のリポジトリ一覧を1ページあたり何件ずつ取得するか（分析用フィールドも含むため控えめに）
+GRAPHQL_PAGE_SIZE = 25
+
+# REST API の /user/repos と同じ形に変換するためのフィールドと分析用フィールドを1回で取得
+GRAPHQL_VIEWER_REPOS_QUERY = """
+query($first: Int!, $cursor: String) {
+  viewer {
+    repositories(first: $first, after: $cursor,
+                 ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER],
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        owner { login }
+        description
+        primaryLanguage { name }
+        diskUsage
+        stargazerCount
+        forkCount
+        createdAt
+        updatedAt
+        pushedAt
+        isFork
+        hasIssuesEnabled
+        licenseInfo { spdxId }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        defaultBranchRef { name }
+""" + GRAPHQL_REPO_FIELDS + """
+      }
+    }
+  }
+}
+"""
+
+# リポジトリ内パスからREADME・CI・テストを検出するパターン（改行区切りのパス一覧に適用）
+README_PATH_RE = re.compile(r'^readme\.', re.IGNORECASE | re.MULTILINE)
+# Dockerfile はファイル名の大文字小文字を区別しない（dockerfile なども対象）
+CI_PATH_RE = re.compile(r'^(?:\.github/workflows/|(?i:Dockerfile)$)', re.MULTILINE)
+TEST_PATH_RE = re.compile(
+    r'(?:^|/)(?:tests?|specs?|__tests__)(?:/|$)|(?:^|/)test_[^/\n]+$|[._-](?:test|spec)\.[a-z]+$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# 複雑度スコアの加点テーブル（値が閾値を超えた最初の行の点数を加算）
+SIZE_SCORE_THRESHOLDS = ((10000, 30), (1000, 15))
+STARS_SCORE_THRESHOLDS = ((100, 20), (10, 10))
+# スコア → 複雑度（閾値以上の最初の行）
+COMPLEXITY_LEVELS = ((60, 'high'), (30, 'medium'), (0, 'low'))
+
+# package.json の dependencies → フレームワーク（判定順）
+PACKAGE_JSON_FRAMEWORKS = (
+    ('React', frozenset({'react', '@types/react'})),
+    ('Vue.js', frozenset({'vue', 'nuxt'})),
+    ('Angular', frozenset({'angular', '@angular/core'})),
+    ('Node.js Backend', frozenset({'express', 'koa', 'fastify'})),
+    ('Static Site Generator', frozenset({'next', 'gatsby'})),
+)
+# 依存名 → フレームワークの逆引き表
+PACKAGE_JSON_DEP_FRAMEWORKS = {dep: framework for framework, deps in PACKAGE_JSON_FRAMEWORKS for dep in deps}
+# package.json に含まれていればフレームワーク判定が必要になる依存名
+PACKAGE_JSON_HINT_RE = re.compile(
+    '"(' + '|'.join(sorted(map(re.escape, PACKAGE_JSON_DEP_FRAMEWORKS))) + ')"'
+)
+# "dependencies" オブジェクト（値はバージョン文字列のみでネストしない）とそのキー
+PACKAGE_JSON_DEPENDENCIES_RE = re.compile(r'"dependencies"\s*:\s*\{([^{}]*)\}')
+PACKAGE_JSON_KEY_RE = re.compile(r'"([^"\\]+)"\s*:')
+
+# requirements.txt のパッケージ名 → フレームワーク
+REQUIREMENTS_FRAMEWORKS = {
+    'django': 'Django',
+    'flask': 'Flask',
+    'fastapi': 'FastAPI',
+    'streamlit': 'Streamlit',
+    'pandas': 'Data Science',
+    'numpy': 'Data Science',
+    'scipy': 'Data Science',
+    'tensorflow': 'Machine Learning',
+    'torch': 'Machine Learning',
+    'pytorch': 'Machine Learning',
+}
+# 各行の先頭のパッケージ名（バージョン指定・extras・コメントの直前まで）
+REQUIREMENTS_RE = re.compile(r'^\s*([A-Za-z0-9_.\-]+)', re.MULTILINE)
+
+# go.mod / Cargo.toml に含まれるモジュール名 → フレームワーク
+GO_MOD_FRAMEWORKS = {
+    'gin-gonic/gin': 'Gin (Go)',
+    'gorilla/mux': 'Gorilla Mux',
+}
+GO_MOD_RE = re.compile('|'.join(map(re.escape, GO_MOD_FRAMEWORKS)))
+
+CARGO_FRAMEWORKS = {
+    'actix-web': 'Actix Web',
+    'rocket': 'Rocket',
+}
+CARGO_RE = re.compile('|'.join(map(re.escape, CARGO_FRAMEWORKS)))
+
+# フレームワーク（小文字）→ カテゴリ。複数該当する場合は CATEGORY_PRIORITY の順に優先
+FRAMEWORK_CATEGORIES = {
+    'react': 'frontend',
+    'vue.js': 'frontend',
+    'angular': 'frontend',
+    'static site generator': 'frontend',
+    'django': 'backend',
+    'flask': 'backend',
+    'fastapi': 'backend',
+    'node.js backend': 'backend',
+    'gin (go)': 'backend',
+    'actix web': 'backend',
+    'data science': 'data/ml',
+    'machine learning': 'data/ml',
+}
+CATEGORY_PRIORITY = ('frontend', 'backend', 'data/ml')
+# フレームワークで決まらない場合の主要言語（小文字）→ カテゴリ
+PRIMARY_LANGUAGE_CATEGORIES = {
+    'javascript': 'frontend',
+    'typescript': 'frontend',
+    'html': 'frontend',
+    'css': 'frontend',
+    'python': 'backend',
+    'java': 'backend',
+    'go': 'backend',
+    'rust': 'backend',
+    'c++': 'backend',
+}
+
+
+# Claude Code 用の分析プロンプト（モジュール読み込み時に1回だけ解析）
+CLAUDE_PROMPT_TEMPLATE = string.Template(r"""# GitHub Portfolio 深層分析依頼
+
+## 👤 開発者の人間性分析
+
+### 作業スタイル
+- **コミットパターン**: ${commitment}
+- **ドキュメント意識**: ${documentation}
+
+### コラボレーションスタイル  
+- **コミュニティでの存在感**: ${visibility}
+- **オープンソース姿勢**: ${openness}
+
+### 技術習慣
+- **テスト・品質への取り組み**: ${testing}
+- **自動化・効率化への姿勢**: ${automation}
+- **複雑性への対応**: ${complexity}
+
+### 開発活動パターン
+- **現在のアクティビティ**: ${activity}
+
+### 数値サマリー
+- **総コミット数**: ${total_commits}
+- **平均コミット数/repo**: ${avg_commits}
+- **テストカバレッジ**: ${test_coverage}/${total_repos} repos (${test_rate}%)
+- **CI/CD導入率**: ${ci_usage}/${total_repos} repos (${ci_rate}%)
+- **READMEカバレッジ**: ${readme_coverage}/${total_repos} repos (${readme_rate}%)
+
+---
+
+あなたは経験豊富なテックリードかつキャリアコンサルタントです。以下のGitHubポートフォリオデータを詳細に分析し、技術的評価とキャリア戦略を提案してください。
+
+## 📊 基本情報
+- **GitHub ユーザー名**: ${login}
+- **公開リポジトリ数**: ${public_repos}
+- **フォロワー数**: ${followers}
+- **分析対象リポジトリ**: ${total_repos}
+
+## 💻 技術スタック詳細
+
+### プログラミング言語分布
+```json
+${languages_json}
+```
+
+### フレームワーク・ライブラリ使用状況
+```json
+${frameworks_json}
+```
+
+### 開発ツール・技術
+```json
+${tools_json}
+```
+
+### プロジェクトカテゴリ分布
+```json
+${categories_json}
+```
+
+## 🎯 開発者能力分析
+
+### 得意分野・専門性
+この開発者の技術的な強みと専門分野を技術スタックから分析：
+
+**言語的専門性:**
+${language_lines}
+
+**技術領域の傾向:**
+- **フロントエンド志向**: ${frontend_count}/${total_repos} projects (${frontend_rate}%)
+- **バックエンド志向**: ${backend_count}/${total_repos} projects (${backend_rate}%)
+- **データ・ML志向**: ${data_ml_count}/${total_repos} projects (${data_ml_rate}%)
+- **DevOps志向**: ${devops_count}/${total_repos} projects (${devops_rate}%)
+
+### プロジェクト品質傾向
+この開発者の開発品質・プロフェッショナリズムの指標：
+
+**品質管理の取り組み:**
+- **テストカバレッジ率**: ${test_coverage}/${total_repos} repos (${test_rate}%) 
+- **CI/CD導入率**: ${ci_usage}/${total_repos} repos (${ci_rate}%)
+- **ドキュメント整備率**: ${readme_coverage}/${total_repos} repos (${readme_rate}%)
+
+**プロジェクト管理スタイル:**
+- **平均プロジェクト複雑度**: ${high_complexity}/${total_repos} high-complexity projects
+- **技術多様性**: ${language_count} programming languages across projects
+- **フレームワーク活用度**: ${framework_count} different frameworks/libraries used
+
+## 📋 分析依頼内容
+
+以下の観点から詳細に分析・評価してください：
+
+### 0. 開発者称号の命名 🏆
+上記の人間性分析と技術データを基に、この開発者にふさわしい**キャッチーで面白い称号**を考案してください：
+
+**称号の例（ファンタジック・RPG風も歓迎）:**
+- 🛡️ TypeScript Guardian（型安全の守護者）
+- 🧙‍♂️ Code Wizard（コード魔法使い）
+- ⚔️ Bug Slayer（バグ討伐者）
+- 🏰 Architecture Architect（設計建築家）
+- 📜 Documentation Sage（ドキュメント賢者）
+- ⚡ Lightning Coder（稲妻コーダー）
+- 🌟 Framework Summoner（フレームワーク召喚師）
+- 🗡️ Legacy Code Warrior（レガシーコード戦士）
+- 🎯 Feature Sniper（機能狙撃手）
+- 🔮 API Alchemist（API錬金術師）
+- 🛠️ DevOps Paladin（DevOps聖騎士）
+- 🐉 Performance Dragon Tamer（パフォーマンス竜使い）
+- 🎭 Frontend Performer（フロントエンド芸人）
+- 🏔️ Backend Mountain Builder（バックエンド山築師）
+
+**不名誉称号も含めて（改善点として）:**
+- 📝 README Hermit（説明書隠者）
+- 🧪 Test Phobic（テスト恐怖症）
+- 💾 Commit Hoarder（コミット貯蔵癖）
+- 🔒 Solo Adventurer（一人冒険者）
+- 🐛 Bug Breeder（バグ養殖家）
+- 📊 Issue Collector（課題コレクター）
+
+**要求:** 称号は必ず絵文字付きで、その人の特徴を的確に表現し、少し面白みのあるものにしてください。
+
+### 1. 技術的スキル評価 (各項目10点満点)
+- **フロントエンド技術力**
+- **バックエンド技術力**
+- **データベース・データ処理**
+- **DevOps・インフラ**
+- **モバイル開発**
+- **AI/ML技術**
+- **技術の多様性と深度**
+- **モダンな技術への適応**
+
+### 2. エンジニアリング品質評価
+- **コード設計・アーキテクチャ**
+- **プロジェクト構成・管理**
+- **ドキュメント・README品質**
+- **テスト・品質保証への取り組み**
+- **セキュリティ意識**
+- **パフォーマンス最適化**
+
+### 3. プロダクト・ビジネス視点
+- **実用性・市場価値**
+- **UI/UX設計力**
+- **問題解決アプローチ**
+- **継続的な開発・メンテナンス**
+- **オープンソース貢献**
+
+### 4. キャリア戦略提案
+- **現在の市場価値(年収レンジ予想)**
+- **強みと弱みの明確化**
+- **次に習得すべき技術(優先度順)**
+- **ポートフォリオ改善項目(具体的)**
+- **転職・キャリアアップ戦略**
+- **学習計画(6ヶ月・1年・3年)**
+
+### 5. 具体的改善提案
+- **不足している技術領域**
+- **作るべきプロジェクト(3-5個)**
+- **既存プロジェクトの改善点**
+- **技術ブログ・発信すべき内容**
+- **参加すべきコミュニティ・イベント**
+
+## 📝 出力形式
+- 各セクションは詳細かつ具体的に
+- スコアは根拠とともに提示
+- 改善提案は実行可能な具体案を
+- 市場動向と照らし合わせた分析を
+- エンジニアのレベル感を考慮した現実的な提案を
+
+よろしくお願いします！
+
+---
+
+## 📤 分析結果の出力指示
+
+分析完了後、以下の形式でMarkdown形式のレポートを出力してください：
+
+\`\`\`markdown
+# 🎭 {決定した称号} - GitHub Portfolio 詳細分析レポート
+
+## 👤 開発者プロフィール
+- **称号**: {決定した称号}
+- **専門分野**: {主な得意分野}
+- **レベル**: {スキルレベル評価}
+
+## 📊 技術スキル評価
+{各項目の10点満点評価と詳細コメント}
+
+## 💼 キャリア戦略
+{年収予想 学習計画 転職戦略など}
+
+## 🛠️ 具体的改善提案
+{作るべきプロジェクト 学習ロードマップなど}
+
+## 🎖️ 総合評価
+{総合的な評価とまとめ}
+\`\`\`
+
+**要求事項**:
+- 称号は必ず絵文字付きで、キャッチーかつ的確なものに
+- 各セクションは詳細かつ具体的に
+- スコアは根拠とともに提示
+- 改善提案は実行可能な具体案を
+- 出力は必ずMarkdown形式で
+
+**使用可能なAIサービス**:
+- Claude (Claude Code、Claude Desktop、claude.ai)
+- ChatGPT (GPT-4、GPT-4o)
+- Gemini
+- その他のLLMサービス
+
+**Claude Code使用時の追加指示**:
+分析結果は必ず `detailed_analysis_report.md` ファイルとしてローカルに保存してください。""")
+
+
+# 開発者カードのスタイル（呼び出しごとに組み立て直さない）
+DEVELOPER_CARD_CSS = """        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;600;700&display=swap');
+        
+        body {
+            margin: 0;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            font-family: 'Inter', sans-serif;
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }
+        
+        .developer-card {
+            background: white;
+            border-radius: 20px;
+            padding: 30px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.15);
+            max-width: 450px;
+            width: 100%;
+            position: relative;
+            overflow: hidden;
+        }
+        
+        .developer-card::before {
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            height: 8px;
+            background: linear-gradient(90deg, #ff6b6b, #4ecdc4, #45b7d1, #96ceb4, #ffeaa7);
+        }
+        
+        .header {
+            text-align: center;
+            margin-bottom: 25px;
+        }
+        
+        .username {
+            font-size: 28px;
+            font-weight: 700;
+            margin: 10px 0 5px 0;
+            color: #2d3436;
+        }
+        
+        .subtitle {
+            color: #636e72;
+            font-size: 14px;
+            margin-bottom: 15px;
+        }
+        
+        .title-section {
+            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+            color: white;
+            padding: 15px;
+            border-radius: 12px;
+            margin-bottom: 20px;
+            text-align: center;
+        }
+        
+        .title {
+            font-size: 18px;
+            font-weight: 600;
+            margin: 0;
+        }
+        
+        .stats-grid {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 15px;
+            margin-bottom: 20px;
+        }
+        
+        .stat-item {
+            background: #f8f9fa;
+            padding: 12px;
+            border-radius: 8px;
+            text-align: center;
+        }
+        
+        .stat-number {
+            font-size: 20px;
+            font-weight: 700;
+            color: #2d3436;
+            display: block;
+        }
+        
+        .stat-label {
+            font-size: 11px;
+            color: #636e72;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+        
+        .skills-section {
+            margin-bottom: 20px;
+        }
+        
+        .section-title {
+            font-size: 14px;
+            font-weight: 600;
+            color: #2d3436;
+            margin-bottom: 10px;
+            display: flex;
+            align-items: center;
+            gap: 8px;
+        }
+        
+        .skill-bar {
+            margin-bottom: 8px;
+        }
+        
+        .skill-name {
+            font-size: 12px;
+            color: #636e72;
+            margin-bottom: 4px;
+            display: flex;
+            justify-content: space-between;
+        }
+        
+        .progress-bar {
+            height: 6px;
+            background: #e9ecef;
+            border-radius: 3px;
+            overflow: hidden;
+        }
+        
+        .progress-fill {
+            height: 100%;
+            background: linear-gradient(90deg, #667eea, #764ba2);
+            transition: width 0.3s ease;
+        }
+        
+        .traits {
+            margin-bottom: 20px;
+        }
+        
+        .trait-item {
+            background: #e8f5e8;
+            color: #2d5a2d;
+            padding: 6px 12px;
+            border-radius: 15px;
+            font-size: 11px;
+            margin: 5px 5px 0 0;
+            display: inline-block;
+        }
+        
+        .generated-info {
+            text-align: center;
+            color: #636e72;
+            font-size: 10px;
+            margin-top: 20px;
+            padding-top: 15px;
+            border-top: 1px solid #e9ecef;
+        }
+"""
+
+
+# 開発者カードのHTML（CSSを埋め込んだ状態でモジュール読み込み時に1回だけ解析）
+DEVELOPER_CARD_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Developer Card - ${login}</title>
+    <style>
+""" + DEVELOPER_CARD_CSS + """    </style>
+</head>
+<body>
+    <div class="developer-card">
+        <div class="header">
+            <div class="username">${login}</div>
+            <div class="subtitle">GitHub Portfolio Analysis</div>
+        </div>
+        
+        <div class="title-section">
+            <div class="title">🎭 称号はClaude Codeで決定してもらってください</div>
+        </div>
+        
+        <div class="stats-grid">
+            <div class="stat-item">
+                <span class="stat-number">${total_repos}</span>
+                <span class="stat-label">Projects</span>
+            </div>
+            <div class="stat-item">
+                <span class="stat-number">${total_commits}</span>
+                <span class="stat-label">Commits</span>
+            </div>
+            <div class="stat-item">
+                <span class="stat-number">${test_coverage}/${total_repos}</span>
+                <span class="stat-label">Test Coverage</span>
+            </div>
+            <div class="stat-item">
+                <span class="stat-number">${readme_coverage}/${total_repos}</span>
+                <span class="stat-label">Documentation</span>
+            </div>
+        </div>
+        
+        <div class="skills-section">
+            <div class="section-title">💻 Top Languages</div>
+            ${language_bars}
+        </div>
+        
+        <div class="skills-section">
+            <div class="section-title">🛠️ Frameworks</div>
+            ${framework_items}
+        </div>
+        
+        <div class="traits">
+            <div class="section-title">🏷️ Developer Traits</div>
+            <div class="trait-item">${commitment}</div>
+            <div class="trait-item">${documentation}</div>
+            <div class="trait-item">${visibility}</div>
+        </div>
+        
+        <div class="generated-info">
+            Generated on ${generated_at} • GitHub Portfolio Analyzer
+        </div>
+    </div>
+</body>
+</html>""")
+
+
+class CachedResponse:
+    """ETagキャッシュから復元したレスポンス（304時に使用）"""
+    
+    status_code = 200
+    
+    def __init__(self, entry: Dict[str, Any]):
+        self.headers = CaseInsensitiveDict(entry['headers'])
+        self.content = entry['content']
+    
+    def json(self) -> Any:
+        return json_loads(self.content)
+    
+    def raise_for_status(self):
+        pass
 
 
 class GitHubAnalyzer:
-    def __init__(self, token: str):
+    def __init__(self, token: str, cache_path: Optional[str] = None, extra_tokens: Optional[List[str]] = None,
+                 cache_ttl: int = 0):
         self.token = token
-        self.headers = {
+        self.headers = self._auth_headers(token)
+        self.session = self._create_session(self.headers)
+        
+        # リポジトリ単位のAPIは追加トークンと交互に使い、レート制限の枠を合算する
+        self.repo_sessions = [self.session] + [self._create_session(self._auth_headers(t)) for t in extra_tokens or []]
+        self._session_cycle = itertools.cycle(self.repo_sessions)
+        self._session_lock = threading.Lock()
+        self._exhausted_until = {}
+        # 追加トークンから見えなかったリポジトリ（owner/name）。以降はメイントークンのみで取得する
+        self._primary_only_repos = set()
+        self.in_flight = threading.BoundedSemaphore(len(self.repo_sessions) * MAX_IN_FLIGHT_PER_TOKEN)
+        # 1リポジトリ内の独立したREST呼び出しを並行させる専用プール（リポジトリ単位の並列とは別）
+        self.request_executor = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE)
+        
+        # 最初のAPI呼び出しがTLSハンドシェイクを待たないよう接続を確立しておく
+        for session in self.repo_sessions:
+            try:
+                session.head('https://api.github.com/', timeout=5)
+            except HTTP_ERRORS:
+                pass
+        
+        # ETagによる条件付きリクエスト用のディスクキャッシュ（304はレート制限を消費しない）
+        self.cache = shelve.open(cache_path) if cache_path else None
+        # この秒数以内に取得・再検証したエントリはリクエストせずにそのまま使う（0 なら毎回再検証）
+        self.cache_ttl = cache_ttl
+        self.cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _auth_headers(token: str) -> Dict[str, str]:
+        """トークンごとのリクエストヘッダー"""
+        return {
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+    
+    def _create_session(self, headers: Dict[str, str]):
+        """HTTPセッションを作成（httpx[http2] があればHTTP/2、なければrequests）"""
+        if httpx is not None:
+            try:
+                return httpx.Client(
+                    http2=True,
+                    headers=headers,
+                    timeout=30.0,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE)
+                )
+            except ImportError:
+                # h2 パッケージがない場合はrequestsを使用
+                pass
+        
+        session = requests.Session()
+        session.headers.update(headers)
+        # 並列実行時にコネクション待ちで直列化しないようプールを拡張
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self):
+        """セッションとキャッシュを閉じる"""
+        self.request_executor.shutdown(wait=True)
+        for session in self.repo_sessions:
+            session.close()
+        if self.cache is not None:
+            with self.cache_lock:
+                self.cache.close()
+            self.cache = None
+    
+    def _request(self, method: str, url: str, **kwargs):
+        """レート制限を考慮してリクエストを送信（403/429 は待機して再試行）"""
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            session = self._session_for(url)
+            with self.in_flight:
+                response = session.request(method, url, **kwargs)
+            if (response.status_code in (403, 404) and session is not self.session
+                    and self._retry_wait(response) is None):
+                # 追加トークンでは見えないリポジトリ（プライベートなど）はメイントークンで取得し直す
+                with self._session_lock:
+                    self._primary_only_repos.add(self._repo_key(url))
+                self._rate_guard(response, session)
+                session = self.session
+                with self.in_flight:
+                    response = session.request(method, url, **kwargs)
+            if response.status_code in (403, 429) and attempt < RATE_LIMIT_MAX_RETRIES:
+                wait = self._retry_wait(response)
+                if wait is not None:
+                    print(f"    ⏳ レート制限に達したため {wait:.0f} 秒待機して再試行します")
+                    time.sleep(wait)
+                    continue
+            self._rate_guard(response, session)
+            return response
+    
+    def _session_for(self, url: str):
+        """リクエストに使うセッションを選択（リポジトリ単位のAPIは残量のあるトークンを順番に使用）"""
+        if len(self.repo_sessions) == 1 or not url.startswith(GITHUB_REPOS_API_PREFIX):
+            return self.session
+        with self._session_lock:
+            if self._repo_key(url) in self._primary_only_repos:
+                return self.session
+            now = time.time()
+            for _ in range(len(self.repo_sessions)):
+                session = next(self._session_cycle)
+                if self._exhausted_until.get(session, 0) <= now:
+                    return session
+        # すべてのトークンの残量が少ない場合は _rate_guard の待機に任せる
+        return self.session
+    
+    @staticmethod
+    def _repo_key(url: str) -> str:
+        """リポジトリ単位のAPIのURLから owner/name を取り出す"""
+        return '/'.join(url[len(GITHUB_REPOS_API_PREFIX):].split('/', 2)[:2])
+    
+    @staticmethod
+    def _retry_wait(response) -> Optional[float]:
+        """レート制限による拒否なら待機秒数を返す（それ以外の 403 は None）"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = response.headers.get('X-RateLimit-Reset')
+            if reset is not None and reset.isdigit():
+                return max(0.0, int(reset) - time.time())
+        return None
+    
+    def _rate_guard(self, response, session=None):
+        """X-RateLimit-Remaining が少なくなったら別のトークンに切り替え、なければリセット時刻まで待機"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None or not remaining.isdigit() or not reset.isdigit():
+            return
+        if int(remaining) < RATE_LIMIT_MIN_REMAINING:
+            if session is not None and len(self.repo_sessions) > 1:
+                with self._session_lock:
+                    self._exhausted_until[session] = int(reset)
+                    now = time.time()
+                    if any(self._exhausted_until.get(s, 0) <= now for s in self.repo_sessions):
+                        return
+            wait = max(0.0, int(reset) - time.time())
+            if wait > 0:
+                print(f"    ⏳ APIレート制限の残りが {remaining} 回のため {wait:.0f} 秒待機します")
+                time.sleep(wait)
+    
+    def _cached_get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None):
+        """ETag/Last-Modified による条件付きGET（変更がなければキャッシュを返す）"""
+        if self.cache is None:
+            return self._request('GET', url, params=params, headers=headers)
+        
+        key = json.dumps([url, sorted((params or {}).items()), sorted((headers or {}).items())])
+        with self.cache_lock:
+            entry = self.cache.get(key)
+        
+        if entry and self.cache_ttl > 0 and time.time() - entry.get('fetched_at', 0) < self.cache_ttl:
+            return CachedResponse(entry)
+        
+        request_headers = dict(headers or {})
+        if entry:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = self._request('GET', url, params=params, headers=request_headers)
+        
+        if response.status_code == 304 and entry:
+            if self.cache_ttl > 0:
+                # 再検証できたので鮮度の起点を更新
+                entry['fetched_at'] = time.time()
+                with self.cache_lock:
+                    self.cache[key] = entry
+            return CachedResponse(entry)
+        
+        # 206 は Range 指定でファイル先頭のみ取得した場合
+        if response.status_code in (200, 206):
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                with self.cache_lock:
+                    self.cache[key] = {
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'headers': dict(response.headers),
+                        'content': response.content,
+                        'fetched_at': time.time()
+                    }
+        
+        return response
         
     def get_user_info(self) -> Dict[str, Any]:
         """認証されたユーザー情報を取得"""
-        response = self.session.get('https://api.github.com/user')
+        response = self._cached_get('https://api.github.com/user')
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
     
     def get_all_repositories(self, max_repos: int = 500) -> List[Dict[str, Any]]:
         """全リポジトリを取得（ページネーション対応）"""
-        repos = []
-        page = 1
         per_page = 100
         
         print(f"📦 リポジトリを取得中...")
         
-        while len(repos) < max_repos:
-            params = {
-                'type': 'all',
-                'sort': 'updated',
-                'per_page': per_page,
-                'page': page
-            }
-            
-            response = self.session.get('https://api.github.com/user/repos', params=params)
-            response.raise_for_status()
-            
-            page_repos = response.json()
-            if not page_repos:
-                break
-                
-            repos.extend(page_repos[:max_repos - len(repos)])
-            print(f"  📋 {len(repos)} 個のリポジトリを取得済み")
-            page += 1
-            
+        response = self._get_repository_page(1, per_page)
+        repos = json_loads(response.content)[:max_repos]
+        print(f"  📋 {len(repos)} 個のリポジトリを取得済み")
+        
+        # 1ページ目の Link: rel="last" で総ページ数が分かるので、必要な残りページはまとめて並列取得
+        match = LINK_LAST_PAGE_RE.search(response.headers.get('Link', ''))
+        if match and len(repos) < max_repos:
+            last_page = min(int(match.group(1)), -(-max_repos // per_page))
+            pages = self.request_executor.map(lambda page: self._get_repository_page(page, per_page),
+                                              range(2, last_page + 1))
+            for page_response in pages:
+                repos.extend(json_loads(page_response.content)[:max_repos - len(repos)])
+                print(f"  📋 {len(repos)} 個のリポジトリを取得済み")
+        
         return repos
     
+    def _get_repository_page(self, page: int, per_page: int):
+        """/user/repos の1ページ分を取得"""
+        params = {
+            'type': 'all',
+            'sort': 'updated',
+            'per_page': per_page,
+            'page': page
+        }
+        response = self._cached_get('https://api.github.com/user/repos', params=params)
+        response.raise_for_status()
+        return response
+    
+    def get_repositories_with_bundles(self, max_repos: int = 500) -> Tuple[List[Dict[str, Any]], Optional[List[Optional[Dict[str, Any]]]]]:
+        """リポジトリ一覧と分析用バンドルをGraphQLのページングで取得
+        
+        GraphQLで取得できない場合はREST APIで一覧のみを取得し、バンドルは None を返す
+        """
+        print(f"📦 リポジトリを取得中...")
+        repos = []
+        bundles = []
+        cursor = None
+        
+        try:
+            while len(repos) < max_repos:
+                data = self._graphql(GRAPHQL_VIEWER_REPOS_QUERY, {
+                    'first': min(GRAPHQL_PAGE_SIZE, max_repos - len(repos)),
+                    'cursor': cursor
+                })
+                connection = data['viewer']['repositories']
+                for node in connection['nodes']:
+                    repos.append(self._repo_from_graphql(node))
+                    bundles.append(self._parse_graphql_repo(node))
+                print(f"  📋 {len(repos)} 個のリポジトリを取得済み")
+                
+                if not connection['pageInfo']['hasNextPage']:
+                    break
+                cursor = connection['pageInfo']['endCursor']
+        except Exception as e:
+            print(f"    ⚠️  GraphQLでの一覧取得エラー（REST APIで取得します）: {e}")
+            return self.get_all_repositories(max_repos), None
+        
+        return repos, bundles
+    
+    @staticmethod
+    def _repo_from_graphql(node: Dict[str, Any]) -> Dict[str, Any]:
+        """GraphQLのrepositoryノードをREST APIのリポジトリ形式に変換"""
+        license_info = node.get('licenseInfo')
+        return {
+            'name': node['name'],
+            'owner': {'login': node['owner']['login']},
+            'description': node.get('description'),
+            'language': (node.get('primaryLanguage') or {}).get('name'),
+            'size': node.get('diskUsage') or 0,
+            'stargazers_count': node.get('stargazerCount', 0),
+            'forks_count': node.get('forkCount', 0),
+            'created_at': node.get('createdAt', ''),
+            'updated_at': node.get('updatedAt', ''),
+            'pushed_at': node.get('pushedAt'),
+            'fork': node.get('isFork', False),
+            'has_issues': node.get('hasIssuesEnabled', False),
+            'license': {'spdx_id': license_info['spdxId']} if license_info else None,
+            'topics': [item['topic']['name'] for item in (node.get('repositoryTopics') or {}).get('nodes', [])],
+            'default_branch': (node.get('defaultBranchRef') or {}).get('name')
+        }
+    
     def get_repository_languages(self, owner: str, repo: str) -> Dict[str, int]:
         """リポジトリの言語統計を取得"""
-        try:
-            response = self.session.get(f'https://api.github.com/repos/{owner}/{repo}/languages')
-            response.raise_for_status()
-            return response.json()
-        except:
-            return {}
+        response = self._cached_get(f'https://api.github.com/repos/{owner}/{repo}/languages')
+        response.raise_for_status()
+        return json_loads(response.content)
     
     def get_repository_contents(self, owner: str, repo: str, path: str = '') -> List[Dict[str, Any]]:
         """リポジトリの内容を取得"""
-        try:
-            response = self.session.get(f'https://api.github.com/repos/{owner}/{repo}/contents/{path}')
-            response.raise_for_status()
-            return response.json()
-        except:
+        response = self._cached_get(f'https://api.github.com/repos/{owner}/{repo}/contents/{path}')
+        if response.status_code == 404:
             return []
+        response.raise_for_status()
+        return json_loads(response.content)
     
-    def get_repository_stats(self, owner: str, repo: str) -> Dict[str, Any]:
-        """リポジトリの統計情報を取得（コミット数、コントリビューター数など）"""
+    def get_repository_tree(self, owner: str, repo: str, branch: str = 'HEAD') -> Optional[Dict[str, Any]]:
+        """ツリー全体のパス一覧を1リクエストで取得（空のリポジトリなどで取得できなければ None）"""
+        response = self._cached_get(f'https://api.github.com/repos/{owner}/{repo}/git/trees/{branch}',
+                                    params={'recursive': 1})
+        if response.status_code != 200:
+            return None
+        return json_loads(response.content)
+    
+    def get_repository_stats(self, repo: Dict[str, Any], tree: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """リポジトリの統計情報を取得（tree があればREADME・テスト・CIの有無も判定）"""
+        owner = repo['owner']['login']
+        name = repo['name']
         stats = {
             'commit_count': 0,
             'contributors_count': 0,
@@ -101,113 +1036,217 @@ class GitHubAnalyzer:
         }
         
         try:
-            # 基本的な存在チェックのみ（効率化）
-            contents_response = self.session.get(f'https://api.github.com/repos/{owner}/{repo}/contents')
-            if contents_response.status_code == 200:
-                contents = contents_response.json()
-                file_names = [item['name'].lower() for item in contents if item['type'] == 'file']
-                
-                # README存在チェック
-                readme_files = ['readme.md', 'readme.rst', 'readme.txt']
-                stats['readme_exists'] = any(readme in file_names for readme in readme_files)
-                
-                # Dockerfile存在チェック
-                stats['has_ci'] = 'dockerfile' in file_names
-                
-                # テスト関連ファイル
-                test_indicators = ['test', 'spec', 'tests', '__tests__']
-                stats['has_tests'] = any(indicator in name for name in file_names for indicator in test_indicators)
+            # サブディレクトリのテスト・CI設定もツリーのパスから検出
+            if tree is not None:
+                stats.update(self._analyze_tree_paths([item['path'] for item in tree.get('tree', [])]))
             
-            # コミット数は基本情報から推定（API効率化）
-            # 更新頻度から大まかに推定
-            # コミット数を正確に取得
-            commits_response = self.session.get(f'https://api.github.com/repos/{owner}/{repo}/commits?per_page=1')
-            if commits_response.status_code == 200:
-                # Linkヘッダーから総ページ数を取得してコミット数を計算
-                link_header = commits_response.headers.get('Link', '')
-                if 'rel="last"' in link_header:
-                    import re
-                    # rel="last"の直前にあるURL部分を抽出
-                    last_url_match = re.search(r'<([^>]+)>;\s*rel="last"', link_header)
-                    if last_url_match:
-                        last_url = last_url_match.group(1)
-                        page_match = re.search(r'[&?]page=(\d+)', last_url)
-                        if page_match:
-                            commit_count = int(page_match.group(1))
-                            stats['commit_count'] = commit_count
-                        else:
-                            stats['commit_count'] = 1
-                    else:
-                        stats['commit_count'] = 1
-                else:
-                    # Linkヘッダーがない場合は1ページのみ
-                    commits_data = commits_response.json()
-                    commit_count = len(commits_data) if commits_data else 1
-                    stats['commit_count'] = commit_count
-            else:
-                stats['commit_count'] = 1
-                    
+            stats['commit_count'] = self.get_commit_count(owner, name)
+        
         except Exception as e:
             print(f"    ⚠️  統計取得エラー: {e}")
         
         return stats
 
-    def get_file_content(self, owner: str, repo: str, path: str) -> Optional[str]:
-        """特定ファイルの中身を取得"""
+    def get_commit_count(self, owner: str, repo: str) -> int:
+        """総コミット数を取得（per_page=1 の Link: rel="last" のページ番号 = コミット数）"""
+        response = self._cached_get(f'https://api.github.com/repos/{owner}/{repo}/commits', params={'per_page': 1})
+        if response.status_code != 200:
+            return 1
+        
+        link_header = response.headers.get('Link', '')
+        if 'rel="last"' not in link_header:
+            # Linkヘッダーがない場合は1ページのみ
+            return len(json_loads(response.content)) or 1
+        
+        match = LINK_LAST_PAGE_RE.search(link_header)
+        return int(match.group(1)) if match else 1
+    
+    def _analyze_tree_paths(self, paths: List[str]) -> Dict[str, bool]:
+        """リポジトリ内のパス一覧からREADME・CI・テストの有無を判定"""
+        # パスごとのループではなく、連結した一覧に対して各パターンを1回だけ走査
+        joined = '\n'.join(paths)
+        return {
+            # ルート直下のREADME
+            'readme_exists': README_PATH_RE.search(joined) is not None,
+            # GitHub Actionsのワークフロー or Dockerfile
+            'has_ci': CI_PATH_RE.search(joined) is not None,
+            # テストディレクトリ・テストファイル
+            'has_tests': TEST_PATH_RE.search(joined) is not None
+        }
+    
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """GraphQLクエリを実行して data を返す（data がなくエラーのみの場合は例外）"""
+        key = None
+        if self.cache is not None and self.cache_ttl > 0:
+            # POSTはETagで再検証できないため、クエリと変数をキーに cache_ttl の間だけ再利用する
+            key = json.dumps(['graphql', hashlib.sha256(query.encode('utf-8')).hexdigest(), variables], sort_keys=True)
+            with self.cache_lock:
+                entry = self.cache.get(key)
+            if entry and time.time() - entry['fetched_at'] < self.cache_ttl:
+                return entry['data']
+        
+        response = self._request('POST', GITHUB_GRAPHQL_URL, json={'query': query, 'variables': variables})
+        response.raise_for_status()
+        payload = json_loads(response.content)
+        data = payload.get('data') or {}
+        if not data and payload.get('errors'):
+            raise ValueError(payload['errors'][0].get('message', 'unknown error'))
+        
+        # 一部のリポジトリが取得できなかった結果はキャッシュしない
+        if key is not None and not payload.get('errors'):
+            with self.cache_lock:
+                self.cache[key] = {'data': data, 'fetched_at': time.time()}
+        return data
+    
+    def _graphql_repo_bundles(self, repos: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """GraphQLで複数リポジトリの言語・ルート一覧・コミット数・技術スタックファイルを一括取得
+        
+        取得できなかったリポジトリは None を返し、呼び出し側でREST APIにフォールバックする
+        """
+        variables = {}
+        params = []
+        fields = []
+        for i, repo in enumerate(repos):
+            variables[f'o{i}'] = repo['owner']['login']
+            variables[f'n{i}'] = repo['name']
+            params.append(f'$o{i}: String!, $n{i}: String!')
+            fields.append(f'r{i}: repository(owner: $o{i}, name: $n{i}) {{{GRAPHQL_REPO_FIELDS}}}')
+        query = f"query({', '.join(params)}) {{\n" + "\n".join(fields) + "\n}"
+        
         try:
-            response = self.session.get(f'https://api.github.com/repos/{owner}/{repo}/contents/{path}')
-            response.raise_for_status()
-            file_data = response.json()
-            
-            if file_data.get('type') == 'file' and file_data.get('size', 0) < 50000:  # 50KB制限
-                import base64
-                content = base64.b64decode(file_data['content']).decode('utf-8', errors='ignore')
-                return content[:10000]  # 最大10000文字
-        except:
-            pass
-        return None
+            data = self._graphql(query, variables)
+        except Exception as e:
+            print(f"    ⚠️  GraphQL一括取得エラー（REST APIで分析します）: {e}")
+            return [None] * len(repos)
+        
+        return [self._parse_graphql_repo(data.get(f'r{i}')) for i in range(len(repos))]
     
-    def analyze_repository_tech_stack(self, repo: Dict[str, Any]) -> Dict[str, Any]:
-        """リポジトリの技術スタックを分析"""
+    def _parse_graphql_repo(self, node: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """GraphQLのrepositoryノードを分析用のバンドルに変換"""
+        if not node:
+            return None
+        
+        languages = {edge['node']['name']: edge['size'] for edge in (node.get('languages') or {}).get('edges', [])}
+        
+        target = (node.get('defaultBranchRef') or {}).get('target') or {}
+        # REST版（get_commit_count）と同じく、空のリポジトリでも1とする
+        commit_count = (target.get('history') or {}).get('totalCount') or 1
+        
+        # ルート直下のエントリとワークフロー定義をパス一覧として扱う
+        paths = [entry['name'] for entry in (node.get('root') or {}).get('entries', [])]
+        paths += [f".github/workflows/{entry['name']}" for entry in (node.get('workflows') or {}).get('entries', [])]
+        
+        files = {}
+        for alias, path in TECH_STACK_FILE_ALIASES.items():
+            blob = node.get(alias) or {}
+            # REST版と同じくファイル先頭のみを使用
+            if blob.get('text'):
+                files[path] = blob['text'][:MAX_FILE_BYTES]
+        
+        return {
+            'languages': languages,
+            'commit_count': commit_count,
+            'paths': paths,
+            'files': files
+        }
+    
+    def get_blob_content(self, owner: str, repo: str, sha: str) -> Optional[str]:
+        """ツリーで見つかったファイルの中身（先頭 MAX_FILE_BYTES バイト）をSHAで取得
+        
+        blobの内容はSHAで一意に決まり変化しないため、デコード済みの文字列をキャッシュし再検証もしない
+        """
+        key = f'blob:{sha}'
+        if self.cache is not None:
+            with self.cache_lock:
+                content = self.cache.get(key)
+            if content is not None:
+                return content
+        
+        response = self._request(
+            'GET', f'https://api.github.com/repos/{owner}/{repo}/git/blobs/{sha}',
+            headers={'Accept': 'application/vnd.github.raw+json', 'Range': f'bytes=0-{MAX_FILE_BYTES - 1}'}
+        )
+        if response.status_code in (404, 416):
+            return None
+        response.raise_for_status()
+        content = response.content[:MAX_FILE_BYTES].decode('utf-8', errors='ignore')
+        
+        if self.cache is not None:
+            with self.cache_lock:
+                self.cache[key] = content
+        return content
+    
+    def _fetch_tech_stack_files(self, owner: str, repo: str, tree: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """技術スタック検出用ファイルのうち存在するものだけ内容を取得"""
+        if tree is not None and not tree.get('truncated'):
+            entries = ((item['path'], item) for item in tree.get('tree', []) if item.get('type') == 'blob')
+        else:
+            # ツリーで存在を確認できない場合はルートの一覧を1回だけ取得し、存在しないファイルへのGETを省く
+            entries = ((item['name'], item) for item in self.get_repository_contents(owner, repo)
+                       if item.get('type') == 'file')
+        shas = {path: item['sha'] for path, item in entries if path in TECH_STACK_FILES}
+        # 存在するファイルを並行して取得（結果は判定順のまま）
+        paths = [path for path in TECH_STACK_FILE_ALIASES.values() if path in shas]
+        contents = self.request_executor.map(lambda path: self.get_blob_content(owner, repo, shas[path]), paths)
+        return {path: content for path, content in zip(paths, contents) if content}
+    
+    def analyze_repository_tech_stack(self, repo: Dict[str, Any], bundle: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """リポジトリの技術スタックを分析（bundle があればGraphQL取得済みデータを使用）"""
+        owner = repo['owner']['login']
+        name = repo['name']
+        
+        # 基本情報（一覧取得時のデータのみから作るため、分析中のエラーでも失われない）
+        basic_info = {
+            'name': name,
+            'description': repo.get('description', '') or '',
+            'primary_language': repo.get('language') or 'Unknown',
+            'size': repo.get('size', 0),
+            'stars': repo.get('stargazers_count', 0),
+            'forks': repo.get('forks_count', 0),
+            'created_at': repo.get('created_at', ''),
+            'updated_at': repo.get('updated_at', ''),
+            'topics': repo.get('topics', []) or [],
+            # 一覧取得時のデータに含まれるため追加のAPI呼び出しは不要
+            'pushed_at': repo.get('pushed_at') or '',
+            'license': (repo.get('license') or {}).get('spdx_id'),
+            'has_issues': repo.get('has_issues', False)
+        }
+        
         try:
-            owner = repo['owner']['login']
-            name = repo['name']
-            
-            # 基本情報
-            analysis = {
-                'name': name,
-                'description': repo.get('description', '') or '',
-                'primary_language': repo.get('language') or 'Unknown',
-                'size': repo.get('size', 0),
-                'stars': repo.get('stargazers_count', 0),
-                'forks': repo.get('forks_count', 0),
-                'created_at': repo.get('created_at', ''),
-                'updated_at': repo.get('updated_at', ''),
-                'topics': repo.get('topics', []) or [],
-                'languages': {},
-                'frameworks': [],
-                'tools': [],
-                'complexity': 'low',
-                'category': 'other'
-            }
-            
-            # 言語統計取得
-            languages = self.get_repository_languages(owner, name)
-            analysis['languages'] = languages
-            
-            # リポジトリ統計取得（効率化のため一部のみ）
-            self.current_repo_size = analysis['size']  # サイズを渡す
-            stats = self.get_repository_stats(owner, name)
-            analysis.update(stats)
+            analysis = {**basic_info, **self._default_detection()}
             
-            # 重要ファイルの分析（効率化）
-            tech_stack_files = ['package.json', 'requirements.txt', 'go.mod', 'Cargo.toml']
-            config_files = ['docker-compose.yml', 'Dockerfile']
-            
-            # 技術スタック検出用ファイルのみ内容を読み込み
-            for file_name in tech_stack_files + config_files:
-                content = self.get_file_content(owner, name, file_name)
-                if content:
+            if bundle is not None:
+                # GraphQLで一括取得済みのデータを使用（追加のAPI呼び出しなし）
+                analysis['languages'] = bundle['languages']
+                analysis.update({
+                    'commit_count': bundle['commit_count'],
+                    'contributors_count': 0,
+                    'branches_count': 0
+                })
+                # README・テスト・CIの判定はREST版と同じく再帰ツリーのパスで行う（ツリーはETagキャッシュ対象）
+                # ツリーが取得できない場合のみ、ルート直下とワークフロー定義のパスで判定
+                tree = self.get_repository_tree(owner, name, repo.get('default_branch') or 'HEAD')
+                paths = [item['path'] for item in tree.get('tree', [])] if tree is not None else bundle['paths']
+                analysis.update(self._analyze_tree_paths(paths))
+                
+                for file_name, content in bundle['files'].items():
+                    analysis = self._analyze_file_content(analysis, file_name, content)
+            else:
+                # 言語統計はツリーの取得と並行して取得
+                languages_future = self.request_executor.submit(self.get_repository_languages, owner, name)
+                
+                # ツリーを1回だけ取得し、統計と技術スタック検出の両方に使う
+                tree = self.get_repository_tree(owner, name, repo.get('default_branch') or 'HEAD')
+                
+                # リポジトリ統計（コミット数）と技術スタック検出用ファイルの取得を並行
+                stats_future = self.request_executor.submit(self.get_repository_stats, repo, tree)
+                files = self._fetch_tech_stack_files(owner, name, tree)
+                
+                analysis['languages'] = languages_future.result()
+                analysis.update(stats_future.result())
+                
+                # 技術スタック検出用ファイルのうち、存在するものだけ内容を解析
+                for file_name, content in files.items():
                     analysis = self._analyze_file_content(analysis, file_name, content)
             
             # 複雑度とカテゴリの推定
@@ -217,919 +1256,565 @@ class GitHubAnalyzer:
         
         except Exception as e:
             print(f"    ⚠️  {name} の分析中にエラー: {e}")
-            # エラー時のデフォルト値を返す
-            return {
-                'name': name,
-                'description': '',
-                'primary_language': 'Unknown',
-                'size': 0,
-                'stars': 0,
-                'forks': 0,
-                'created_at': '',
-                'updated_at': '',
-                'topics': [],
-                'languages': {},
-                'frameworks': [],
-                'tools': [],
-                'complexity': 'low',
-                'category': 'other'
-            }
+            # 基本情報は保持し、検出結果のみデフォルト値に戻す（成功時と同じキーで返す）
+            return {**basic_info, **self._default_detection()}
+    
+    @staticmethod
+    def _default_detection() -> Dict[str, Any]:
+        """APIから検出する項目のデフォルト値"""
+        return {
+            'languages': {},
+            'frameworks': [],
+            'tools': [],
+            'complexity': 'low',
+            'category': 'other',
+            'commit_count': 0,
+            'contributors_count': 0,
+            'branches_count': 0,
+            'readme_exists': False,
+            'has_tests': False,
+            'has_ci': False
+        }
+    
+    def analyze_repositories(self, repos: List[Dict[str, Any]], max_workers: int = DEFAULT_WORKERS,
+                             bundles: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
+        """複数リポジトリを並列に分析（bundles がなければGraphQLでまとめて取得）"""
+        # GitHubのセカンダリレート制限に収まるよう同時実行数を制限
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            if bundles is not None:
+                # 一覧取得時にGraphQLで取得済みのバンドルを使用
+                futures = [executor.submit(self.analyze_repository_tech_stack, repo, bundle)
+                           for repo, bundle in zip(repos, bundles)]
+            else:
+                # GraphQLでまとめて取得し、取得できなかったリポジトリのみREST APIで分析
+                # 取得済みのバッチから分析を投入し、残りのGraphQL取得と重ねて実行する
+                batches = [repos[i:i + GRAPHQL_BATCH_SIZE] for i in range(0, len(repos), GRAPHQL_BATCH_SIZE)]
+                bundle_futures = [executor.submit(self._graphql_repo_bundles, batch) for batch in batches]
+                futures = [
+                    executor.submit(self.analyze_repository_tech_stack, repo, bundle)
+                    for batch, bundle_future in zip(batches, bundle_futures)
+                    for repo, bundle in zip(batch, bundle_future.result())
+                ]
+            
+            # 完了した順に進捗を表示し、結果は元の順番の位置に格納
+            indexes = {future: i for i, future in enumerate(futures)}
+            analyses = [None] * len(futures)
+            for done, future in enumerate(as_completed(indexes), 1):
+                analysis = future.result()
+                analyses[indexes[future]] = analysis
+                print(f"🔎 [{done:3d}/{len(repos):3d}] {analysis['name']} を分析しました")
+        
+        return analyses
     
     def _analyze_file_content(self, analysis: Dict[str, Any], filename: str, content: str) -> Dict[str, Any]:
         """ファイル内容から技術スタックを推定"""
         
         if filename == 'package.json':
-            try:
-                pkg_data = json.loads(content)
-                deps = list(pkg_data.get('dependencies', {}).keys())
-                dev_deps = list(pkg_data.get('devDependencies', {}).keys())
-                
-                # フレームワーク検出
-                frameworks = []
-                if any(dep in deps for dep in ['react', '@types/react']):
-                    frameworks.append('React')
-                if any(dep in deps for dep in ['vue', 'nuxt']):
-                    frameworks.append('Vue.js')
-                if any(dep in deps for dep in ['angular', '@angular/core']):
-                    frameworks.append('Angular')
-                if any(dep in deps for dep in ['express', 'koa', 'fastify']):
-                    frameworks.append('Node.js Backend')
-                if any(dep in deps for dep in ['next', 'gatsby']):
-                    frameworks.append('Static Site Generator')
-                
-                analysis['frameworks'].extend(frameworks)
-                analysis['tools'].extend(['npm/yarn'])
-                
-            except json.JSONDecodeError:
-                pass
-        
-        elif filename == 'requirements.txt':
-            lines = content.strip().split('\n')
-            frameworks = []
+            # フレームワーク候補の依存名が1つもなければJSONの解析を省略
+            if not PACKAGE_JSON_HINT_RE.search(content):
+                analysis['tools'].append('npm/yarn')
+                return analysis
             
-            for line in lines:
-                package = line.split('==')[0].split('>=')[0].split('~=')[0].strip()
-                if package in ['django', 'Django']:
-                    frameworks.append('Django')
-                elif package in ['flask', 'Flask']:
-                    frameworks.append('Flask')
-                elif package in ['fastapi', 'FastAPI']:
-                    frameworks.append('FastAPI')
-                elif package in ['streamlit']:
-                    frameworks.append('Streamlit')
-                elif package in ['pandas', 'numpy', 'scipy']:
-                    frameworks.append('Data Science')
-                elif package in ['tensorflow', 'torch', 'pytorch']:
-                    frameworks.append('Machine Learning')
+            # dependencies のキーだけを文字列から直接抽出し、見つからない場合のみJSONを解析
+            match = PACKAGE_JSON_DEPENDENCIES_RE.search(content)
+            if match:
+                deps = set(PACKAGE_JSON_KEY_RE.findall(match.group(1)))
+            else:
+                try:
+                    deps = json_loads(content).get('dependencies', {}).keys()
+                except json.JSONDecodeError:
+                    return analysis
             
-            analysis['frameworks'].extend(frameworks)
+            # 依存名を1回走査して逆引きし、判定順に並べて追加
+            found = {PACKAGE_JSON_DEP_FRAMEWORKS.get(dep) for dep in deps}
+            analysis['frameworks'].extend(framework for framework, _ in PACKAGE_JSON_FRAMEWORKS if framework in found)
+            analysis['tools'].extend(['npm/yarn'])
+        
+        elif filename == 'requirements.txt':
+            # 全行を1回の正規表現スキャンで抽出し、対象パッケージとの集合演算で判定
+            packages = REQUIREMENTS_FRAMEWORKS.keys() & {package.lower() for package in REQUIREMENTS_RE.findall(content)}
+            # 同じフレームワーク（pandas と numpy など）は1つにまとめ、表の順に追加
+            analysis['frameworks'].extend(dict.fromkeys(
+                framework for package, framework in REQUIREMENTS_FRAMEWORKS.items() if package in packages
+            ))
             analysis['tools'].extend(['pip'])
         
         elif filename in ['go.mod']:
-            if 'gin-gonic/gin' in content:
-                analysis['frameworks'].append('Gin (Go)')
-            if 'gorilla/mux' in content:
-                analysis['frameworks'].append('Gorilla Mux')
+            found = set(GO_MOD_RE.findall(content))
+            analysis['frameworks'].extend(fw for module, fw in GO_MOD_FRAMEWORKS.items() if module in found)
             analysis['tools'].append('Go Modules')
         
         elif filename == 'Cargo.toml':
-            if 'actix-web' in content:
-                analysis['frameworks'].append('Actix Web')
-            if 'rocket' in content:
-                analysis['frameworks'].append('Rocket')
-            analysis['tools'].append('Cargo')
-        
-        elif filename == 'Dockerfile':
-            analysis['tools'].append('Docker')
-        
-        elif filename == 'docker-compose.yml':
-            analysis['tools'].append('Docker Compose')
-        
-        return analysis
-    
-    def _estimate_complexity_and_category(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """複雑度とカテゴリを推定"""
-        
-        # 複雑度推定
-        complexity_score = 0
-        
-        # 言語数
-        lang_count = len(analysis['languages'])
-        complexity_score += min(lang_count * 10, 30)
-        
-        # フレームワーク数
-        framework_count = len(analysis['frameworks'])
-        complexity_score += min(framework_count * 15, 45)
-        
-        # ファイルサイズ
-        size = analysis['size']
-        if size > 10000:
-            complexity_score += 30
-        elif size > 1000:
-            complexity_score += 15
-        
-        # スター数（人気度）
-        stars = analysis['stars']
-        if stars > 100:
-            complexity_score += 20
-        elif stars > 10:
-            complexity_score += 10
-        
-        if complexity_score >= 60:
-            analysis['complexity'] = 'high'
-        elif complexity_score >= 30:
-            analysis['complexity'] = 'medium'
-        else:
-            analysis['complexity'] = 'low'
-        
-        # カテゴリ推定
-        primary_lang = (analysis['primary_language'] or '').lower()
-        frameworks = [f.lower() for f in analysis['frameworks']]
-        
-        if any(f in frameworks for f in ['react', 'vue.js', 'angular', 'static site generator']):
-            analysis['category'] = 'frontend'
-        elif any(f in frameworks for f in ['django', 'flask', 'fastapi', 'node.js backend', 'gin (go)', 'actix web']):
-            analysis['category'] = 'backend'
-        elif any(f in frameworks for f in ['data science', 'machine learning']):
-            analysis['category'] = 'data/ml'
-        elif 'docker' in analysis['tools']:
-            analysis['category'] = 'devops'
-        elif primary_lang in ['javascript', 'typescript', 'html', 'css']:
-            analysis['category'] = 'frontend'
-        elif primary_lang in ['python', 'java', 'go', 'rust', 'c++']:
-            analysis['category'] = 'backend'
-        else:
-            analysis['category'] = 'other'
-        
-        return analysis
-    
-    def generate_portfolio_report(self, analyses: List[Dict[str, Any]]) -> str:
-        """ポートフォリオレポートを生成"""
-        
-        # 統計計算
-        total_repos = len(analyses)
-        languages = Counter()
-        frameworks = Counter()
-        categories = Counter()
-        complexities = Counter()
-        
-        total_stars = 0
-        total_forks = 0
-        
-        for analysis in analyses:
-            # 言語統計（バイト数加重）
-            for lang, bytes_count in analysis['languages'].items():
-                languages[lang] += bytes_count
-            
-            # フレームワーク統計
-            for framework in analysis['frameworks']:
-                frameworks[framework] += 1
-            
-            # カテゴリ統計
-            categories[analysis['category']] += 1
-            
-            # 複雑度統計
-            complexities[analysis['complexity']] += 1
-            
-            # スター・フォーク数
-            total_stars += analysis['stars']
-            total_forks += analysis['forks']
-        
-        # レポート生成
-        report = f"""
-# 🚀 GitHub Portfolio Analysis Report
-生成日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 📊 Portfolio Overview
-- **総リポジトリ数**: {total_repos}
-- **総スター数**: {total_stars}
-- **総フォーク数**: {total_forks}
-- **平均スター数**: {total_stars/max(total_repos, 1):.1f}
-
-## 💻 技術スタック分析
-
-### プログラミング言語 (上位10位)
-"""
-        
-        # 言語ランキング
-        top_languages = languages.most_common(10)
-        total_bytes = sum(languages.values())
-        
-        for i, (lang, bytes_count) in enumerate(top_languages, 1):
-            percentage = (bytes_count / max(total_bytes, 1)) * 100
-            report += f"{i:2d}. **{lang}**: {percentage:.1f}% ({bytes_count:,} bytes)\n"
-        
-        report += "\n### フレームワーク・ライブラリ (上位10位)\n"
-        
-        # フレームワークランキング
-        top_frameworks = frameworks.most_common(10)
-        for i, (framework, count) in enumerate(top_frameworks, 1):
-            percentage = (count / max(total_repos, 1)) * 100
-            report += f"{i:2d}. **{framework}**: {count} projects ({percentage:.1f}%)\n"
-        
-        report += f"""
-## 🎯 プロジェクト分析
-
-### カテゴリ別分布
-"""
-        
-        # カテゴリ分布
-        for category, count in categories.most_common():
-            percentage = (count / max(total_repos, 1)) * 100
-            report += f"- **{category.title()}**: {count} projects ({percentage:.1f}%)\n"
-        
-        report += "\n### 複雑度分布\n"
-        
-        # 複雑度分布
-        for complexity, count in complexities.most_common():
-            percentage = (count / max(total_repos, 1)) * 100
-            report += f"- **{complexity.title()}**: {count} projects ({percentage:.1f}%)\n"
-        
-        # 推奨事項
-        report += self._generate_recommendations(analyses, languages, frameworks, categories)
-        
-        return report
-    
-    def _generate_recommendations(self, analyses: List[Dict[str, Any]], 
-                                languages: Counter, frameworks: Counter, 
-                                categories: Counter) -> str:
-        """推奨事項を生成"""
-        
-        recommendations = "\n## 🎯 推奨事項\n\n"
-        
-        # 技術的多様性の分析
-        lang_diversity = len(languages)
-        framework_diversity = len(frameworks)
-        
-        recommendations += "### 技術スキル向上\n"
-        
-        # 言語の推奨
-        top_lang = languages.most_common(1)[0][0] if languages else "Unknown"
-        
-        if lang_diversity < 3:
-            recommendations += f"- 現在のメイン言語は **{top_lang}** です。技術的多様性向上のため、以下の言語学習を推奨:\n"
-            suggestions = []
-            if 'Python' not in languages:
-                suggestions.append("Python（データサイエンス・バックエンド）")
-            if 'JavaScript' not in languages and 'TypeScript' not in languages:
-                suggestions.append("JavaScript/TypeScript（フロントエンド・フルスタック）")
-            if 'Go' not in languages:
-                suggestions.append("Go（高性能バックエンド）")
-            
-            for suggestion in suggestions[:2]:  # 最大2つまで
-                recommendations += f"  - {suggestion}\n"
-        
-        # フレームワークの推奨
-        if framework_diversity < 5:
-            recommendations += "- モダンなフレームワーク学習を推奨:\n"
-            
-            frontend_frameworks = [f for f in frameworks if f in ['React', 'Vue.js', 'Angular']]
-            if not frontend_frameworks:
-                recommendations += "  - **React** または **Vue.js** (フロントエンド開発)\n"
-            
-            backend_frameworks = [f for f in frameworks if f in ['Django', 'Flask', 'FastAPI', 'Express']]
-            if not backend_frameworks:
-                recommendations += "  - **FastAPI** または **Express** (バックエンドAPI開発)\n"
-        
-        # プロジェクトタイプの推奨
-        recommendations += "\n### ポートフォリオ強化\n"
-        
-        if categories['frontend'] == 0:
-            recommendations += "- **フロントエンド・プロジェクト**: ユーザーインターフェース開発スキルの証明\n"
-        
-        if categories['backend'] == 0:
-            recommendations += "- **バックエンド・API**: サーバーサイド開発とデータベース設計スキルの証明\n"
-        
-        if categories['data/ml'] == 0:
-            recommendations += "- **データ分析・機械学習**: 現代的なデータ活用スキルの証明\n"
-        
-        if categories['devops'] < 2:
-            recommendations += "- **DevOps・インフラ**: Docker、CI/CD、クラウドデプロイメントスキルの証明\n"
-        
-        # 品質向上の推奨
-        recommendations += "\n### コード品質向上\n"
-        
-        low_star_repos = len([a for a in analyses if a['stars'] == 0])
-        if low_star_repos > len(analyses) * 0.8:
-            recommendations += "- **README改善**: プロジェクトの目的・使用方法・技術選択理由を明確に記載\n"
-            recommendations += "- **デモ・スクリーンショット**: 実際の動作を視覚的に示す\n"
-        
-        recommendations += "- **テストコード**: 品質保証とプロフェッショナリズムの証明\n"
-        recommendations += "- **ドキュメント**: API仕様書、アーキテクチャ図などの技術文書\n"
-        
-        return recommendations
-    
-    def generate_human_focused_analysis(self, analyses, user_info):
-        """人に焦点を当てた開発者分析を生成"""
-        
-        total_repos = len(analyses)
-        total_commits = sum(a.get('commit_count', 0) for a in analyses)
-        test_repos = sum(1 for a in analyses if a.get('has_tests', False))
-        ci_repos = sum(1 for a in analyses if a.get('has_ci', False))
-        readme_repos = sum(1 for a in analyses if a.get('readme_exists', False))
-        
-        # 開発者の傾向分析
-        analysis = {
-            'working_style': {},
-            'collaboration_style': {},
-            'technical_habits': {},
-            'productivity_patterns': {},
-            'quality_consciousness': {}
-        }
-        
-        # === 作業スタイル分析 ===
-        avg_commits = total_commits / max(total_repos, 1)
-        if avg_commits > 100:
-            analysis['working_style']['commitment'] = "高頻度コミッター - 小さな変更を頻繁にコミットする丁寧な作業スタイル"
-        elif avg_commits > 20:
-            analysis['working_style']['commitment'] = "安定的コミッター - 適度なペースで着実に開発を進める"
-        else:
-            analysis['working_style']['commitment'] = "一気集中型 - まとまった機能を一度に実装するタイプ"
-        
-        # ドキュメント意識
-        readme_rate = readme_repos / max(total_repos, 1)
-        if readme_rate > 0.8:
-            analysis['working_style']['documentation'] = "ドキュメント完璧主義者 - 他者への配慮を重視する丁寧な開発者"
-        elif readme_rate > 0.5:
-            analysis['working_style']['documentation'] = "ドキュメント意識良好 - バランス感覚のある実践的な開発者"
-        elif readme_rate > 0.2:
-            analysis['working_style']['documentation'] = "コード重視派 - 実装に集中し、ドキュメントは後回しにしがち"
-        else:
-            analysis['working_style']['documentation'] = "ドキュメント軽視派 - コードで語るタイプ（要改善）"
-        
-        # === コラボレーションスタイル ===
-        # フォロワー数から判断
-        followers = user_info.get('followers', 0)
-        public_repos = user_info.get('public_repos', 0)
-        
-        if followers > 50:
-            analysis['collaboration_style']['visibility'] = "コミュニティリーダー - 影響力のある発信者"
-        elif followers > 10:
-            analysis['collaboration_style']['visibility'] = "アクティブメンバー - コミュニティに積極参加"
-        else:
-            analysis['collaboration_style']['visibility'] = "サイレントワーカー - 静かに開発に取り組む職人気質"
-        
-        # リポジトリ公開率
-        if public_repos > 30:
-            analysis['collaboration_style']['openness'] = "オープンソース推進派 - 積極的にコードを公開・共有"
-        elif public_repos > 10:
-            analysis['collaboration_style']['openness'] = "適度な公開派 - バランス良くコードを共有"
-        else:
-            analysis['collaboration_style']['openness'] = "プライベート重視派 - 慎重にコードを管理"
-        
-        # === 技術習慣 ===
-        test_rate = test_repos / max(total_repos, 1)
-        if test_rate > 0.7:
-            analysis['technical_habits']['testing'] = "テスト駆動開発者 - 品質第一の堅実な開発手法"
-        elif test_rate > 0.3:
-            analysis['technical_habits']['testing'] = "品質意識派 - 重要なプロジェクトではテストを実装"
-        elif test_rate > 0.1:
-            analysis['technical_habits']['testing'] = "テスト学習中 - 品質向上に取り組み始めている"
-        else:
-            analysis['technical_habits']['testing'] = "テスト後回し派 - スピード重視、品質は運用で解決しがち"
-        
-        ci_rate = ci_repos / max(total_repos, 1)
-        if ci_rate > 0.5:
-            analysis['technical_habits']['automation'] = "自動化マスター - 効率的なワークフローを構築"
-        elif ci_rate > 0.2:
-            analysis['technical_habits']['automation'] = "自動化導入中 - モダンな開発手法を学習・実践"
-        else:
-            analysis['technical_habits']['automation'] = "手動派 - 従来型の開発スタイルを維持"
+            found = set(CARGO_RE.findall(content))
+            analysis['frameworks'].extend(fw for crate, fw in CARGO_FRAMEWORKS.items() if crate in found)
+            analysis['tools'].append('Cargo')
         
-        # === 成長パターン ===
-        recent_activity = len([a for a in analyses if self._is_recent_project(a)])
-        if recent_activity / max(total_repos, 1) > 0.6:
-            analysis['productivity_patterns']['activity'] = "現在進行形 - 活発に新しいプロジェクトに取り組んでいる"
-        elif recent_activity > 0:
-            analysis['productivity_patterns']['activity'] = "選択的アクティブ - 厳選したプロジェクトに集中"
-        else:
-            analysis['productivity_patterns']['activity'] = "過去の遺産 - 現在はあまりアクティブでない可能性"
+        elif filename == 'Dockerfile':
+            analysis['tools'].append('Docker')
         
-        # === 問題解決スタイル ===
-        complexity_high = len([a for a in analyses if a.get('complexity') == 'high'])
-        if complexity_high / max(total_repos, 1) > 0.4:
-            analysis['technical_habits']['complexity'] = "複雑性挑戦者 - 難しい問題に積極的に取り組む"
-        elif complexity_high > 0:
-            analysis['technical_habits']['complexity'] = "バランス志向 - 適度な難易度のプロジェクトを選択"
-        else:
-            analysis['technical_habits']['complexity'] = "シンプル指向 - 分かりやすく実用的なソリューションを重視"
+        elif filename == 'docker-compose.yml':
+            analysis['tools'].append('Docker Compose')
         
         return analysis
     
-    def _is_recent_project(self, analysis: Dict[str, Any]) -> bool:
-        """プロジェクトが最近アクティブかどうか判定"""
-        try:
-            if analysis.get('updated_at'):
-                updated = datetime.fromisoformat(analysis['updated_at'].replace('Z', '+00:00'))
-                return updated > datetime.now().replace(tzinfo=updated.tzinfo) - timedelta(days=180)
-        except:
-            pass
-        return False
-    
-    def save_detailed_analysis(self, analyses: List[Dict[str, Any]], filename: str = 'portfolio_analysis.json'):
-        """詳細分析結果をJSONで保存"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(analyses, f, ensure_ascii=False, indent=2)
-        print(f"💾 詳細分析結果を {filename} に保存しました")
+    @staticmethod
+    def _complexity_score(lang_count: int, framework_count: int, size: int, stars: int) -> int:
+        """複雑度スコアを計算（言語数・フレームワーク数・サイズ・スター数）"""
+        return (
+            min(lang_count * 10, 30)
+            + min(framework_count * 15, 45)
+            # ファイルサイズ
+            + next((score for threshold, score in SIZE_SCORE_THRESHOLDS if size > threshold), 0)
+            # スター数（人気度）
+            + next((score for threshold, score in STARS_SCORE_THRESHOLDS if stars > threshold), 0)
+        )
     
-    def generate_claude_analysis_prompt(self, analyses: List[Dict[str, Any]], user_info: Dict[str, Any]) -> str:
-        """Claude Code用の詳細分析プロンプトを生成"""
+    def _estimate_complexity_and_category(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """複雑度とカテゴリを推定"""
         
-        # 統計計算
-        total_repos = len(analyses)
+        # 複雑度推定
+        complexity_score = self._complexity_score(
+            len(analysis['languages']), len(analysis['frameworks']), analysis['size'], analysis['stars']
+        )
+        analysis['complexity'] = next(level for threshold, level in COMPLEXITY_LEVELS if complexity_score >= threshold)
+        
+        # カテゴリ推定
+        # フレームワークごとに1回の辞書引きで該当カテゴリを集める
+        found = {FRAMEWORK_CATEGORIES.get(f.lower()) for f in analysis['frameworks']}
+        category = next((c for c in CATEGORY_PRIORITY if c in found), None)
+        if category is None and 'Docker' in analysis['tools']:
+            category = 'devops'
+        if category is None:
+            category = PRIMARY_LANGUAGE_CATEGORIES.get((analysis['primary_language'] or '').lower(), 'other')
+        analysis['category'] = category
+        
+        return analysis
+    
+    def aggregate_analyses(self, analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """全リポジトリの統計を集計（レポート・プロンプト生成で共有）"""
         languages = Counter()
         frameworks = Counter()
-        categories = Counter()
         tools = Counter()
+        categories = Counter()
+        complexities = Counter()
+        total_stars = total_forks = total_commits = test_coverage = ci_usage = readme_coverage = zero_star_repos = 0
         
-        total_commits = 0
-        test_coverage = 0
-        ci_usage = 0
-        
+        # 1回の走査ですべての統計を集計
         for analysis in analyses:
-            # 言語統計
-            for lang, bytes_count in analysis['languages'].items():
-                languages[lang] += bytes_count
-            
-            # フレームワーク・ツール統計
-            for framework in analysis['frameworks']:
-                frameworks[framework] += 1
-            for tool in analysis['tools']:
-                tools[tool] += 1
-            
-            # カテゴリ統計
+            # 言語統計（バイト数加重）・フレームワーク・ツール統計（Counter.update はC実装で加算）
+            languages.update(analysis['languages'])
+            # フレームワーク・ツールは「使用しているリポジトリ数」なので、1リポジトリ内の重複は1回と数える
+            # （set ではなく dict.fromkeys で検出順を保ち、同数時の並び順を安定させる）
+            frameworks.update(dict.fromkeys(analysis['frameworks'], 1))
+            tools.update(dict.fromkeys(analysis['tools'], 1))
             categories[analysis['category']] += 1
+            complexities[analysis['complexity']] += 1
             
-            # 統計値蓄積
+            stars = analysis['stars']
+            total_stars += stars
+            zero_star_repos += stars == 0
+            total_forks += analysis['forks']
             total_commits += analysis.get('commit_count', 0)
-            if analysis.get('has_tests', False):
-                test_coverage += 1
-            if analysis.get('has_ci', False):
-                ci_usage += 1
+            test_coverage += bool(analysis.get('has_tests', False))
+            ci_usage += bool(analysis.get('has_ci', False))
+            readme_coverage += bool(analysis.get('readme_exists', False))
+        
+        return {
+            'total_repos': len(analyses),
+            'languages': languages,
+            'frameworks': frameworks,
+            'tools': tools,
+            'categories': categories,
+            'complexities': complexities,
+            'total_stars': total_stars,
+            'total_forks': total_forks,
+            'total_commits': total_commits,
+            'test_coverage': test_coverage,
+            'ci_usage': ci_usage,
+            'readme_coverage': readme_coverage,
+            'zero_star_repos': zero_star_repos
+        }
+    
+    def generate_portfolio_report(self, analyses: List[Dict[str, Any]],
+                                  aggregate: Optional[Dict[str, Any]] = None) -> str:
+        """ポートフォリオレポートを生成（aggregate があれば集計済みの統計を使用）"""
         
-        # 人間重視の分析生成
-        human_analysis = self.generate_human_focused_analysis(analyses, user_info)
+        # 統計計算
+        aggregate = aggregate or self.aggregate_analyses(analyses)
+        total_repos = aggregate['total_repos']
+        languages = aggregate['languages']
+        frameworks = aggregate['frameworks']
+        categories = aggregate['categories']
+        complexities = aggregate['complexities']
+        total_stars = aggregate['total_stars']
+        total_forks = aggregate['total_forks']
         
-        # プロンプト生成
-        prompt = f"""# GitHub Portfolio 深層分析依頼
-
-## 👤 開発者の人間性分析
-
-### 作業スタイル
-- **コミットパターン**: {human_analysis['working_style']['commitment']}
-- **ドキュメント意識**: {human_analysis['working_style']['documentation']}
-
-### コラボレーションスタイル  
-- **コミュニティでの存在感**: {human_analysis['collaboration_style']['visibility']}
-- **オープンソース姿勢**: {human_analysis['collaboration_style']['openness']}
-
-### 技術習慣
-- **テスト・品質への取り組み**: {human_analysis['technical_habits']['testing']}
-- **自動化・効率化への姿勢**: {human_analysis['technical_habits']['automation']}
-- **複雑性への対応**: {human_analysis['technical_habits']['complexity']}
-
-### 開発活動パターン
-- **現在のアクティビティ**: {human_analysis['productivity_patterns']['activity']}
-
-### 数値サマリー
-- **総コミット数**: {total_commits:,}
-- **平均コミット数/repo**: {total_commits/max(total_repos, 1):.1f}
-- **テストカバレッジ**: {test_coverage}/{total_repos} repos ({test_coverage/max(total_repos, 1)*100:.1f}%)
-- **CI/CD導入率**: {ci_usage}/{total_repos} repos ({ci_usage/max(total_repos, 1)*100:.1f}%)
-- **READMEカバレッジ**: {len([a for a in analyses if a.get('readme_exists', False)])}/{total_repos} repos ({len([a for a in analyses if a.get('readme_exists', False)])/max(total_repos, 1)*100:.1f}%)
-
----
-
-あなたは経験豊富なテックリードかつキャリアコンサルタントです。以下のGitHubポートフォリオデータを詳細に分析し、技術的評価とキャリア戦略を提案してください。
-
-## 📊 基本情報
-- **GitHub ユーザー名**: {user_info.get('login', 'N/A')}
-- **公開リポジトリ数**: {user_info.get('public_repos', 'N/A')}
-- **フォロワー数**: {user_info.get('followers', 'N/A')}
-- **分析対象リポジトリ**: {total_repos}
-
-## 💻 技術スタック詳細
-
-### プログラミング言語分布
-```json
-{json.dumps(dict(languages.most_common()), ensure_ascii=False, indent=2)}
-```
-
-### フレームワーク・ライブラリ使用状況
-```json
-{json.dumps(dict(frameworks.most_common()), ensure_ascii=False, indent=2)}
-```
-
-### 開発ツール・技術
-```json
-{json.dumps(dict(tools.most_common()), ensure_ascii=False, indent=2)}
-```
-
-### プロジェクトカテゴリ分布
-```json
-{json.dumps(dict(categories.most_common()), ensure_ascii=False, indent=2)}
-```
-
-## 🎯 開発者能力分析
-
-### 得意分野・専門性
-この開発者の技術的な強みと専門分野を技術スタックから分析：
-
-**言語的専門性:**
-{chr(10).join(f"- **{lang}**: {(bytes_count/sum(languages.values())*100):.1f}%の使用率" for lang, bytes_count in languages.most_common(3))}
-
-**技術領域の傾向:**
-- **フロントエンド志向**: {categories.get('frontend', 0)}/{total_repos} projects ({categories.get('frontend', 0)/max(total_repos, 1)*100:.1f}%)
-- **バックエンド志向**: {categories.get('backend', 0)}/{total_repos} projects ({categories.get('backend', 0)/max(total_repos, 1)*100:.1f}%)
-- **データ・ML志向**: {categories.get('data/ml', 0)}/{total_repos} projects ({categories.get('data/ml', 0)/max(total_repos, 1)*100:.1f}%)
-- **DevOps志向**: {categories.get('devops', 0)}/{total_repos} projects ({categories.get('devops', 0)/max(total_repos, 1)*100:.1f}%)
-
-### プロジェクト品質傾向
-この開発者の開発品質・プロフェッショナリズムの指標：
-
-**品質管理の取り組み:**
-- **テストカバレッジ率**: {test_coverage}/{total_repos} repos ({test_coverage/max(total_repos, 1)*100:.1f}%) 
-- **CI/CD導入率**: {ci_usage}/{total_repos} repos ({ci_usage/max(total_repos, 1)*100:.1f}%)
-- **ドキュメント整備率**: {len([a for a in analyses if a.get('readme_exists', False)])}/{total_repos} repos ({len([a for a in analyses if a.get('readme_exists', False)])/max(total_repos, 1)*100:.1f}%)
-
-**プロジェクト管理スタイル:**
-- **平均プロジェクト複雑度**: {sum(1 for a in analyses if a.get('complexity') == 'high')}/{total_repos} high-complexity projects
-- **技術多様性**: {len(languages)} programming languages across projects
-- **フレームワーク活用度**: {len(frameworks)} different frameworks/libraries used
-
-## 📋 分析依頼内容
-
-以下の観点から詳細に分析・評価してください：
-
-### 0. 開発者称号の命名 🏆
-上記の人間性分析と技術データを基に、この開発者にふさわしい**キャッチーで面白い称号**を考案してください：
-
-**称号の例（ファンタジック・RPG風も歓迎）:**
-- 🛡️ TypeScript Guardian（型安全の守護者）
-- 🧙‍♂️ Code Wizard（コード魔法使い）
-- ⚔️ Bug Slayer（バグ討伐者）
-- 🏰 Architecture Architect（設計建築家）
-- 📜 Documentation Sage（ドキュメント賢者）
-- ⚡ Lightning Coder（稲妻コーダー）
-- 🌟 Framework Summoner（フレームワーク召喚師）
-- 🗡️ Legacy Code Warrior（レガシーコード戦士）
-- 🎯 Feature Sniper（機能狙撃手）
-- 🔮 API Alchemist（API錬金術師）
-- 🛠️ DevOps Paladin（DevOps聖騎士）
-- 🐉 Performance Dragon Tamer（パフォーマンス竜使い）
-- 🎭 Frontend Performer（フロントエンド芸人）
-- 🏔️ Backend Mountain Builder（バックエンド山築師）
-
-**不名誉称号も含めて（改善点として）:**
-- 📝 README Hermit（説明書隠者）
-- 🧪 Test Phobic（テスト恐怖症）
-- 💾 Commit Hoarder（コミット貯蔵癖）
-- 🔒 Solo Adventurer（一人冒険者）
-- 🐛 Bug Breeder（バグ養殖家）
-- 📊 Issue Collector（課題コレクター）
-
-**要求:** 称号は必ず絵文字付きで、その人の特徴を的確に表現し、少し面白みのあるものにしてください。
-
-### 1. 技術的スキル評価 (各項目10点満点)
-- **フロントエンド技術力**
-- **バックエンド技術力**
-- **データベース・データ処理**
-- **DevOps・インフラ**
-- **モバイル開発**
-- **AI/ML技術**
-- **技術の多様性と深度**
-- **モダンな技術への適応**
-
-### 2. エンジニアリング品質評価
-- **コード設計・アーキテクチャ**
-- **プロジェクト構成・管理**
-- **ドキュメント・README品質**
-- **テスト・品質保証への取り組み**
-- **セキュリティ意識**
-- **パフォーマンス最適化**
-
-### 3. プロダクト・ビジネス視点
-- **実用性・市場価値**
-- **UI/UX設計力**
-- **問題解決アプローチ**
-- **継続的な開発・メンテナンス**
-- **オープンソース貢献**
-
-### 4. キャリア戦略提案
-- **現在の市場価値(年収レンジ予想)**
-- **強みと弱みの明確化**
-- **次に習得すべき技術(優先度順)**
-- **ポートフォリオ改善項目(具体的)**
-- **転職・キャリアアップ戦略**
-- **学習計画(6ヶ月・1年・3年)**
-
-### 5. 具体的改善提案
-- **不足している技術領域**
-- **作るべきプロジェクト(3-5個)**
-- **既存プロジェクトの改善点**
-- **技術ブログ・発信すべき内容**
-- **参加すべきコミュニティ・イベント**
-
-## 📝 出力形式
-- 各セクションは詳細かつ具体的に
-- スコアは根拠とともに提示
-- 改善提案は実行可能な具体案を
-- 市場動向と照らし合わせた分析を
-- エンジニアのレベル感を考慮した現実的な提案を
-
-よろしくお願いします！
-
----
-
-## 📤 分析結果の出力指示
-
-分析完了後、以下の形式でMarkdown形式のレポートを出力してください：
-
-\`\`\`markdown
-# 🎭 {{決定した称号}} - GitHub Portfolio 詳細分析レポート
-
-## 👤 開発者プロフィール
-- **称号**: {{決定した称号}}
-- **専門分野**: {{主な得意分野}}
-- **レベル**: {{スキルレベル評価}}
-
-## 📊 技術スキル評価
-{{各項目の10点満点評価と詳細コメント}}
-
-## 💼 キャリア戦略
-{{年収予想 学習計画 転職戦略など}}
-
-## 🛠️ 具体的改善提案
-{{作るべきプロジェクト 学習ロードマップなど}}
-
-## 🎖️ 総合評価
-{{総合的な評価とまとめ}}
-\`\`\`
+        # レポート生成
+        report = [f"""
+# 🚀 GitHub Portfolio Analysis Report
+生成日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-**要求事項**:
-- 称号は必ず絵文字付きで、キャッチーかつ的確なものに
-- 各セクションは詳細かつ具体的に
-- スコアは根拠とともに提示
-- 改善提案は実行可能な具体案を
-- 出力は必ずMarkdown形式で
+## 📊 Portfolio Overview
+- **総リポジトリ数**: {total_repos}
+- **総スター数**: {total_stars}
+- **総フォーク数**: {total_forks}
+- **平均スター数**: {total_stars/max(total_repos, 1):.1f}
 
-**使用可能なAIサービス**:
-- Claude (Claude Code、Claude Desktop、claude.ai)
-- ChatGPT (GPT-4、GPT-4o)
-- Gemini
-- その他のLLMサービス
+## 💻 技術スタック分析
 
-**Claude Code使用時の追加指示**:
-分析結果は必ず `detailed_analysis_report.md` ファイルとしてローカルに保存してください。"""
+### プログラミング言語 (上位10位)
+"""]
+        
+        # 言語ランキング
+        top_languages = with_percentages(languages.most_common(10), sum(languages.values()))
+        
+        for i, (lang, bytes_count, percentage) in enumerate(top_languages, 1):
+            report.append(f"{i:2d}. **{lang}**: {percentage:.1f}% ({bytes_count:,} bytes)\n")
+        
+        report.append("\n### フレームワーク・ライブラリ (上位10位)\n")
+        
+        # フレームワークランキング
+        top_frameworks = with_percentages(frameworks.most_common(10), total_repos)
+        for i, (framework, count, percentage) in enumerate(top_frameworks, 1):
+            report.append(f"{i:2d}. **{framework}**: {count} projects ({percentage:.1f}%)\n")
+        
+        report.append(f"""
+## 🎯 プロジェクト分析
 
-        return prompt
+### カテゴリ別分布
+""")
+        
+        # カテゴリ分布
+        for category, count, percentage in with_percentages(categories.most_common(), total_repos):
+            report.append(f"- **{category.title()}**: {count} projects ({percentage:.1f}%)\n")
+        
+        report.append("\n### 複雑度分布\n")
+        
+        # 複雑度分布
+        for complexity, count, percentage in with_percentages(complexities.most_common(), total_repos):
+            report.append(f"- **{complexity.title()}**: {count} projects ({percentage:.1f}%)\n")
+        
+        # 推奨事項
+        report.append(self._generate_recommendations(aggregate))
+        
+        return ''.join(report)
     
-    def generate_developer_card_html(self, analyses: List[Dict[str, Any]], user_info: Dict[str, Any], languages: Counter, frameworks: Counter) -> str:
-        """開発者カード用のHTMLを生成"""
+    def _generate_recommendations(self, aggregate: Dict[str, Any]) -> str:
+        """推奨事項を生成（aggregate_analyses の集計結果を使用）"""
+        languages = aggregate['languages']
+        frameworks = aggregate['frameworks']
+        categories = aggregate['categories']
+        
+        recommendations = ["\n## 🎯 推奨事項\n\n"]
+        
+        # 技術的多様性の分析
+        lang_diversity = len(languages)
+        framework_diversity = len(frameworks)
+        
+        recommendations.append("### 技術スキル向上\n")
+        
+        # 言語の推奨
+        top_lang = languages.most_common(1)[0][0] if languages else "Unknown"
+        
+        if lang_diversity < 3:
+            recommendations.append(f"- 現在のメイン言語は **{top_lang}** です。技術的多様性向上のため、以下の言語学習を推奨:\n")
+            suggestions = []
+            if 'Python' not in languages:
+                suggestions.append("Python（データサイエンス・バックエンド）")
+            if 'JavaScript' not in languages and 'TypeScript' not in languages:
+                suggestions.append("JavaScript/TypeScript（フロントエンド・フルスタック）")
+            if 'Go' not in languages:
+                suggestions.append("Go（高性能バックエンド）")
+            
+            for suggestion in suggestions[:2]:  # 最大2つまで
+                recommendations.append(f"  - {suggestion}\n")
         
-        human_analysis = self.generate_human_focused_analysis(analyses, user_info)
-        total_commits = sum(a.get('commit_count', 0) for a in analyses)
-        test_coverage = sum(1 for a in analyses if a.get('has_tests', False))
-        ci_usage = sum(1 for a in analyses if a.get('has_ci', False))
-        readme_coverage = sum(1 for a in analyses if a.get('readme_exists', False))
+        # フレームワークの推奨
+        if framework_diversity < 5:
+            recommendations.append("- モダンなフレームワーク学習を推奨:\n")
+            
+            frontend_frameworks = [f for f in frameworks if f in ['React', 'Vue.js', 'Angular']]
+            if not frontend_frameworks:
+                recommendations.append("  - **React** または **Vue.js** (フロントエンド開発)\n")
+            
+            backend_frameworks = [f for f in frameworks if f in ['Django', 'Flask', 'FastAPI', 'Express']]
+            if not backend_frameworks:
+                recommendations.append("  - **FastAPI** または **Express** (バックエンドAPI開発)\n")
         
-        # トップ3言語
-        top_languages = languages.most_common(3)
-        total_bytes = sum(languages.values())
+        # プロジェクトタイプの推奨
+        recommendations.append("\n### ポートフォリオ強化\n")
         
-        # トップフレームワーク
-        top_frameworks = frameworks.most_common(3)
+        if categories['frontend'] == 0:
+            recommendations.append("- **フロントエンド・プロジェクト**: ユーザーインターフェース開発スキルの証明\n")
         
-        html = f"""
-<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Developer Card - {user_info.get('login', 'Unknown')}</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;600;700&display=swap');
+        if categories['backend'] == 0:
+            recommendations.append("- **バックエンド・API**: サーバーサイド開発とデータベース設計スキルの証明\n")
         
-        body {{
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            font-family: 'Inter', sans-serif;
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
+        if categories['data/ml'] == 0:
+            recommendations.append("- **データ分析・機械学習**: 現代的なデータ活用スキルの証明\n")
         
-        .developer-card {{
-            background: white;
-            border-radius: 20px;
-            padding: 30px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.15);
-            max-width: 450px;
-            width: 100%;
-            position: relative;
-            overflow: hidden;
-        }}
+        if categories['devops'] < 2:
+            recommendations.append("- **DevOps・インフラ**: Docker、CI/CD、クラウドデプロイメントスキルの証明\n")
         
-        .developer-card::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 8px;
-            background: linear-gradient(90deg, #ff6b6b, #4ecdc4, #45b7d1, #96ceb4, #ffeaa7);
-        }}
+        # 品質向上の推奨
+        recommendations.append("\n### コード品質向上\n")
         
-        .header {{
-            text-align: center;
-            margin-bottom: 25px;
-        }}
+        if aggregate['zero_star_repos'] > aggregate['total_repos'] * 0.8:
+            recommendations.append("- **README改善**: プロジェクトの目的・使用方法・技術選択理由を明確に記載\n")
+            recommendations.append("- **デモ・スクリーンショット**: 実際の動作を視覚的に示す\n")
         
-        .username {{
-            font-size: 28px;
-            font-weight: 700;
-            margin: 10px 0 5px 0;
-            color: #2d3436;
-        }}
+        recommendations.append("- **テストコード**: 品質保証とプロフェッショナリズムの証明\n")
+        recommendations.append("- **ドキュメント**: API仕様書、アーキテクチャ図などの技術文書\n")
         
-        .subtitle {{
-            color: #636e72;
-            font-size: 14px;
-            margin-bottom: 15px;
-        }}
+        return ''.join(recommendations)
+    
+    def generate_human_focused_analysis(self, analyses, user_info):
+        """人に焦点を当てた開発者分析を生成"""
         
-        .title-section {{
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-            color: white;
-            padding: 15px;
-            border-radius: 12px;
-            margin-bottom: 20px;
-            text-align: center;
-        }}
+        total_repos = len(analyses)
+        cutoff_iso = self._recent_cutoff_iso()
+        
+        # 必要な件数を1回の走査でまとめて数える
+        total_commits = test_repos = ci_repos = readme_repos = recent_activity = complexity_high = 0
+        for a in analyses:
+            total_commits += a.get('commit_count', 0)
+            test_repos += bool(a.get('has_tests'))
+            ci_repos += bool(a.get('has_ci'))
+            readme_repos += bool(a.get('readme_exists'))
+            recent_activity += self._is_recent_project(a, cutoff_iso)
+            complexity_high += a.get('complexity') == 'high'
         
-        .title {{
-            font-size: 18px;
-            font-weight: 600;
-            margin: 0;
-        }}
+        # 開発者の傾向分析
+        analysis = {
+            'working_style': {},
+            'collaboration_style': {},
+            'technical_habits': {},
+            'productivity_patterns': {},
+            'quality_consciousness': {}
+        }
         
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 15px;
-            margin-bottom: 20px;
-        }}
+        # === 作業スタイル分析 ===
+        avg_commits = total_commits / max(total_repos, 1)
+        if avg_commits > 100:
+            analysis['working_style']['commitment'] = "高頻度コミッター - 小さな変更を頻繁にコミットする丁寧な作業スタイル"
+        elif avg_commits > 20:
+            analysis['working_style']['commitment'] = "安定的コミッター - 適度なペースで着実に開発を進める"
+        else:
+            analysis['working_style']['commitment'] = "一気集中型 - まとまった機能を一度に実装するタイプ"
         
-        .stat-item {{
-            background: #f8f9fa;
-            padding: 12px;
-            border-radius: 8px;
-            text-align: center;
-        }}
+        # ドキュメント意識
+        readme_rate = readme_repos / max(total_repos, 1)
+        if readme_rate > 0.8:
+            analysis['working_style']['documentation'] = "ドキュメント完璧主義者 - 他者への配慮を重視する丁寧な開発者"
+        elif readme_rate > 0.5:
+            analysis['working_style']['documentation'] = "ドキュメント意識良好 - バランス感覚のある実践的な開発者"
+        elif readme_rate > 0.2:
+            analysis['working_style']['documentation'] = "コード重視派 - 実装に集中し、ドキュメントは後回しにしがち"
+        else:
+            analysis['working_style']['documentation'] = "ドキュメント軽視派 - コードで語るタイプ（要改善）"
         
-        .stat-number {{
-            font-size: 20px;
-            font-weight: 700;
-            color: #2d3436;
-            display: block;
-        }}
+        # === コラボレーションスタイル ===
+        # フォロワー数から判断
+        followers = user_info.get('followers', 0)
+        public_repos = user_info.get('public_repos', 0)
         
-        .stat-label {{
-            font-size: 11px;
-            color: #636e72;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
+        if followers > 50:
+            analysis['collaboration_style']['visibility'] = "コミュニティリーダー - 影響力のある発信者"
+        elif followers > 10:
+            analysis['collaboration_style']['visibility'] = "アクティブメンバー - コミュニティに積極参加"
+        else:
+            analysis['collaboration_style']['visibility'] = "サイレントワーカー - 静かに開発に取り組む職人気質"
         
-        .skills-section {{
-            margin-bottom: 20px;
-        }}
+        # リポジトリ公開率
+        if public_repos > 30:
+            analysis['collaboration_style']['openness'] = "オープンソース推進派 - 積極的にコードを公開・共有"
+        elif public_repos > 10:
+            analysis['collaboration_style']['openness'] = "適度な公開派 - バランス良くコードを共有"
+        else:
+            analysis['collaboration_style']['openness'] = "プライベート重視派 - 慎重にコードを管理"
         
-        .section-title {{
-            font-size: 14px;
-            font-weight: 600;
-            color: #2d3436;
-            margin-bottom: 10px;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
+        # === 技術習慣 ===
+        test_rate = test_repos / max(total_repos, 1)
+        if test_rate > 0.7:
+            analysis['technical_habits']['testing'] = "テスト駆動開発者 - 品質第一の堅実な開発手法"
+        elif test_rate > 0.3:
+            analysis['technical_habits']['testing'] = "品質意識派 - 重要なプロジェクトではテストを実装"
+        elif test_rate > 0.1:
+            analysis['technical_habits']['testing'] = "テスト学習中 - 品質向上に取り組み始めている"
+        else:
+            analysis['technical_habits']['testing'] = "テスト後回し派 - スピード重視、品質は運用で解決しがち"
         
-        .skill-bar {{
-            margin-bottom: 8px;
-        }}
+        ci_rate = ci_repos / max(total_repos, 1)
+        if ci_rate > 0.5:
+            analysis['technical_habits']['automation'] = "自動化マスター - 効率的なワークフローを構築"
+        elif ci_rate > 0.2:
+            analysis['technical_habits']['automation'] = "自動化導入中 - モダンな開発手法を学習・実践"
+        else:
+            analysis['technical_habits']['automation'] = "手動派 - 従来型の開発スタイルを維持"
         
-        .skill-name {{
-            font-size: 12px;
-            color: #636e72;
-            margin-bottom: 4px;
-            display: flex;
-            justify-content: space-between;
-        }}
+        # === 成長パターン ===
+        if recent_activity / max(total_repos, 1) > 0.6:
+            analysis['productivity_patterns']['activity'] = "現在進行形 - 活発に新しいプロジェクトに取り組んでいる"
+        elif recent_activity > 0:
+            analysis['productivity_patterns']['activity'] = "選択的アクティブ - 厳選したプロジェクトに集中"
+        else:
+            analysis['productivity_patterns']['activity'] = "過去の遺産 - 現在はあまりアクティブでない可能性"
         
-        .progress-bar {{
-            height: 6px;
-            background: #e9ecef;
-            border-radius: 3px;
-            overflow: hidden;
-        }}
+        # === 問題解決スタイル ===
+        if complexity_high / max(total_repos, 1) > 0.4:
+            analysis['technical_habits']['complexity'] = "複雑性挑戦者 - 難しい問題に積極的に取り組む"
+        elif complexity_high > 0:
+            analysis['technical_habits']['complexity'] = "バランス志向 - 適度な難易度のプロジェクトを選択"
+        else:
+            analysis['technical_habits']['complexity'] = "シンプル指向 - 分かりやすく実用的なソリューションを重視"
         
-        .progress-fill {{
-            height: 100%;
-            background: linear-gradient(90deg, #667eea, #764ba2);
-            transition: width 0.3s ease;
-        }}
+        return analysis
+    
+    def _recent_cutoff_iso(self) -> str:
+        """「最近」とみなす境界（180日前）をGitHubと同じISO 8601形式（UTC）で返す"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=180)
+        return cutoff.strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    def _is_recent_project(self, analysis: Dict[str, Any], cutoff_iso: Optional[str] = None) -> bool:
+        """プロジェクトが最近アクティブかどうか判定
+        
+        GitHubの日時は YYYY-MM-DDTHH:MM:SSZ 形式なので、datetimeに変換せず文字列のまま比較できる
+        """
+        updated_at = analysis.get('updated_at')
+        if not updated_at:
+            return False
+        return updated_at > (cutoff_iso or self._recent_cutoff_iso())
+    
+    def save_detailed_analysis(self, analyses: List[Dict[str, Any]], filename: str = 'portfolio_analysis.json'):
+        """詳細分析結果をJSONで保存"""
+        write_output(filename, json_dumps_bytes(analyses))
+        print(f"💾 詳細分析結果を {filename} に保存しました")
+    
+    def generate_claude_analysis_prompt(self, analyses: List[Dict[str, Any]], user_info: Dict[str, Any],
+                                        aggregate: Optional[Dict[str, Any]] = None,
+                                        human_analysis: Optional[Dict[str, Any]] = None) -> str:
+        """Claude Code用の詳細分析プロンプトを生成（aggregate・human_analysis があれば計算済みの結果を使用）"""
         
-        .traits {{
-            margin-bottom: 20px;
-        }}
+        # 統計計算
+        aggregate = aggregate or self.aggregate_analyses(analyses)
+        total_repos = aggregate['total_repos']
+        languages = aggregate['languages']
+        frameworks = aggregate['frameworks']
+        categories = aggregate['categories']
+        tools = aggregate['tools']
+        total_commits = aggregate['total_commits']
+        test_coverage = aggregate['test_coverage']
+        ci_usage = aggregate['ci_usage']
+        readme_coverage = aggregate['readme_coverage']
+        high_complexity = aggregate['complexities']['high']
+        # 件数 → リポジトリ全体に対する割合(%)の係数（除算はここで1回だけ）
+        repo_scale = 100.0 / max(total_repos, 1)
+        
+        # 言語別の使用率（上位3言語）は合計を1回だけ計算して組み立てる
+        language_lines = '\n'.join(
+            f"- **{lang}**: {percentage:.1f}%の使用率"
+            for lang, _, percentage in with_percentages(languages.most_common(3), sum(languages.values()))
+        )
         
-        .trait-item {{
-            background: #e8f5e8;
-            color: #2d5a2d;
-            padding: 6px 12px;
-            border-radius: 15px;
-            font-size: 11px;
-            margin: 5px 5px 0 0;
-            display: inline-block;
-        }}
+        # 人間重視の分析生成
+        human_analysis = human_analysis or self.generate_human_focused_analysis(analyses, user_info)
         
-        .generated-info {{
-            text-align: center;
-            color: #636e72;
-            font-size: 10px;
-            margin-top: 20px;
-            padding-top: 15px;
-            border-top: 1px solid #e9ecef;
-        }}
-    </style>
-</head>
-<body>
-    <div class="developer-card">
-        <div class="header">
-            <div class="username">{user_info.get('login', 'Unknown')}</div>
-            <div class="subtitle">GitHub Portfolio Analysis</div>
-        </div>
+        # プロンプト生成
+        prompt = CLAUDE_PROMPT_TEMPLATE.substitute(
+            commitment=human_analysis['working_style']['commitment'],
+            documentation=human_analysis['working_style']['documentation'],
+            visibility=human_analysis['collaboration_style']['visibility'],
+            openness=human_analysis['collaboration_style']['openness'],
+            testing=human_analysis['technical_habits']['testing'],
+            automation=human_analysis['technical_habits']['automation'],
+            complexity=human_analysis['technical_habits']['complexity'],
+            activity=human_analysis['productivity_patterns']['activity'],
+            total_commits=f"{total_commits:,}",
+            avg_commits=f"{total_commits/max(total_repos, 1):.1f}",
+            total_repos=total_repos,
+            test_coverage=test_coverage,
+            test_rate=f"{test_coverage * repo_scale:.1f}",
+            ci_usage=ci_usage,
+            ci_rate=f"{ci_usage * repo_scale:.1f}",
+            readme_coverage=readme_coverage,
+            readme_rate=f"{readme_coverage * repo_scale:.1f}",
+            login=user_info.get('login', 'N/A'),
+            public_repos=user_info.get('public_repos', 'N/A'),
+            followers=user_info.get('followers', 'N/A'),
+            languages_json=json_dumps(dict(languages.most_common())),
+            frameworks_json=json_dumps(dict(frameworks.most_common())),
+            tools_json=json_dumps(dict(tools.most_common())),
+            categories_json=json_dumps(dict(categories.most_common())),
+            language_lines=language_lines,
+            frontend_count=categories.get('frontend', 0),
+            frontend_rate=f"{categories.get('frontend', 0) * repo_scale:.1f}",
+            backend_count=categories.get('backend', 0),
+            backend_rate=f"{categories.get('backend', 0) * repo_scale:.1f}",
+            data_ml_count=categories.get('data/ml', 0),
+            data_ml_rate=f"{categories.get('data/ml', 0) * repo_scale:.1f}",
+            devops_count=categories.get('devops', 0),
+            devops_rate=f"{categories.get('devops', 0) * repo_scale:.1f}",
+            high_complexity=high_complexity,
+            language_count=len(languages),
+            framework_count=len(frameworks)
+        )
+
+        return prompt
+    
+    def generate_developer_card_html(self, analyses: List[Dict[str, Any]], user_info: Dict[str, Any],
+                                     languages: Counter, frameworks: Counter,
+                                     human_analysis: Optional[Dict[str, Any]] = None,
+                                     aggregate: Optional[Dict[str, Any]] = None,
+                                     generated_at: Optional[str] = None) -> str:
+        """開発者カード用のHTMLを生成（human_analysis・aggregate・generated_at があれば計算済みの値を使用）"""
         
-        <div class="title-section">
-            <div class="title">🎭 称号はClaude Codeで決定してもらってください</div>
-        </div>
+        # コミット数などの統計は aggregate_analyses の1回の走査で集計したものを使用
+        aggregate = aggregate or self.aggregate_analyses(analyses)
         
-        <div class="stats-grid">
-            <div class="stat-item">
-                <span class="stat-number">{len(analyses)}</span>
-                <span class="stat-label">Projects</span>
-            </div>
-            <div class="stat-item">
-                <span class="stat-number">{total_commits:,}</span>
-                <span class="stat-label">Commits</span>
-            </div>
-            <div class="stat-item">
-                <span class="stat-number">{test_coverage}/{len(analyses)}</span>
-                <span class="stat-label">Test Coverage</span>
-            </div>
-            <div class="stat-item">
-                <span class="stat-number">{readme_coverage}/{len(analyses)}</span>
-                <span class="stat-label">Documentation</span>
-            </div>
-        </div>
+        human_analysis = human_analysis or self.generate_human_focused_analysis(analyses, user_info)
         
-        <div class="skills-section">
-            <div class="section-title">💻 Top Languages</div>
-            {chr(10).join(f'''
+        # テンプレートはモジュール読み込み時に1回だけ構築済み。埋め込む値はHTMLエスケープする
+        total_bytes = sum(languages.values())
+        if not total_bytes:
+            # 言語データがなければ割合の計算やバーの生成は行わない
+            language_bars = '<div class="trait-item">No language data</div>'
+        else:
+            # トップ3言語（割合は1言語につき1回だけ計算）
+            top_languages = with_percentages(languages.most_common(3), total_bytes)
+            language_bars = '\n'.join(f"""
             <div class="skill-bar">
                 <div class="skill-name">
-                    <span>{lang}</span>
-                    <span>{(bytes_count/max(total_bytes, 1)*100):.1f}%</span>
+                    <span>{html.escape(lang)}</span>
+                    <span>{percentage:.1f}%</span>
                 </div>
                 <div class="progress-bar">
-                    <div class="progress-fill" style="width: {(bytes_count/max(total_bytes, 1)*100):.1f}%"></div>
+                    <div class="progress-fill" style="width: {percentage:.1f}%"></div>
                 </div>
-            </div>''' for lang, bytes_count in top_languages)}
-        </div>
-        
-        <div class="skills-section">
-            <div class="section-title">🛠️ Frameworks</div>
-            {chr(10).join(f'<div class="trait-item">{framework} ({count})</div>' for framework, count in top_frameworks)}
-        </div>
-        
-        <div class="traits">
-            <div class="section-title">🏷️ Developer Traits</div>
-            <div class="trait-item">{human_analysis['working_style']['commitment'].split(' - ')[0]}</div>
-            <div class="trait-item">{human_analysis['working_style']['documentation'].split(' - ')[0]}</div>
-            <div class="trait-item">{human_analysis['collaboration_style']['visibility'].split(' - ')[0]}</div>
-        </div>
-        
-        <div class="generated-info">
-            Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')} • GitHub Portfolio Analyzer
-        </div>
-    </div>
-</body>
-</html>"""
+            </div>""" for lang, _, percentage in top_languages)
         
-        return html
+        # トップフレームワーク
+        if frameworks:
+            framework_items = '\n'.join(
+                f'<div class="trait-item">{html.escape(framework)} ({count})</div>'
+                for framework, count in frameworks.most_common(3)
+            )
+        else:
+            framework_items = '<div class="trait-item">No frameworks detected</div>'
+        
+        return DEVELOPER_CARD_TEMPLATE.substitute(
+            login=html.escape(user_info.get('login', 'Unknown')),
+            total_repos=aggregate['total_repos'],
+            total_commits=f"{aggregate['total_commits']:,}",
+            test_coverage=aggregate['test_coverage'],
+            readme_coverage=aggregate['readme_coverage'],
+            language_bars=language_bars,
+            framework_items=framework_items,
+            commitment=html.escape(human_analysis['working_style']['commitment'].split(' - ')[0]),
+            documentation=html.escape(human_analysis['working_style']['documentation'].split(' - ')[0]),
+            visibility=html.escape(human_analysis['collaboration_style']['visibility'].split(' - ')[0]),
+            # 複数枚を生成する場合は呼び出し側で1回だけ求めた生成日時を渡せる
+            generated_at=generated_at or datetime.now().strftime('%Y-%m-%d %H:%M')
+        )
 
 
 def main():
@@ -1138,9 +1823,19 @@ def main():
     parser.add_argument('--max-repos', type=int, default=100, help='分析するリポジトリの最大数')
     parser.add_argument('--output', default='report.md', help='レポート出力ファイル名')
     parser.add_argument('--save-json', action='store_true', help='詳細分析結果をJSONで保存')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='並列に分析するリポジトリ数')
+    parser.add_argument('--cache-file', default='.github_cache', help='APIレスポンス（ETag）キャッシュのファイル名')
+    parser.add_argument('--no-cache', action='store_true', help='APIレスポンスのキャッシュを使用しない')
+    parser.add_argument('--cache-ttl', type=int, default=0,
+                        help='キャッシュを再検証せずに使う秒数（GraphQLの結果にも適用。0: 毎回ETagで再検証）')
+    parser.add_argument('--debug', action='store_true', help='HTTP接続のデバッグログを表示（接続の再利用を確認）')
     
     args = parser.parse_args()
     
+    if args.debug:
+        # httpx/httpcore・urllib3 が新規接続の確立や再利用をログ出力する
+        logging.basicConfig(level=logging.DEBUG, format='%(name)s: %(message)s')
+    
     # .envファイルを読み込み
     load_env_file()
     
@@ -1151,31 +1846,32 @@ def main():
         print("   --token オプションまたは GITHUB_TOKEN 環境変数を設定してください")
         sys.exit(1)
     
+    # 追加のトークン（カンマ区切り）はリポジトリ単位のAPI呼び出しに分散して使用
+    extra_tokens = [t.strip() for t in os.getenv('GITHUB_TOKENS', '').split(',') if t.strip() and t.strip() != token]
+    
+    analyzer = None
     try:
-        analyzer = GitHubAnalyzer(token)
+        analyzer = GitHubAnalyzer(token, cache_path=None if args.no_cache else args.cache_file,
+                                  extra_tokens=extra_tokens, cache_ttl=args.cache_ttl)
         
         # ユーザー情報取得
         user_info = analyzer.get_user_info()
         print(f"🔍 {user_info['login']} のポートフォリオを分析中...")
         
         # リポジトリ取得
-        repos = analyzer.get_all_repositories(args.max_repos)
+        repos, bundles = analyzer.get_repositories_with_bundles(args.max_repos)
         print(f"📦 {len(repos)} 個のリポジトリを取得しました")
         
-        # 各リポジトリを分析
-        analyses = []
-        for i, repo in enumerate(repos, 1):
-            print(f"🔎 [{i:3d}/{len(repos):3d}] {repo['name']} を分析中...")
-            analysis = analyzer.analyze_repository_tech_stack(repo)
-            analyses.append(analysis)
+        # 各リポジトリを並列に分析
+        analyses = analyzer.analyze_repositories(repos, args.workers, bundles)
         
-        # レポート生成
+        # レポート生成（集計は1回だけ行い、レポートとプロンプトで共有）
         print("📊 レポートを生成中...")
-        report = analyzer.generate_portfolio_report(analyses)
+        aggregate = analyzer.aggregate_analyses(analyses)
+        report = analyzer.generate_portfolio_report(analyses, aggregate)
         
         # レポート保存
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(report)
+        write_output(args.output, report)
         
         print(f"✅ 分析完了！レポートを {args.output} に保存しました")
         
@@ -1183,11 +1879,11 @@ def main():
         if args.save_json:
             analyzer.save_detailed_analysis(analyses)
         
-        # Claude Code用の詳細分析プロンプトを生成
-        claude_prompt = analyzer.generate_claude_analysis_prompt(analyses, user_info)
+        # Claude Code用の詳細分析プロンプトを生成（人間重視の分析は1回だけ行い、プロンプト・カードで共有可能）
+        human_analysis = analyzer.generate_human_focused_analysis(analyses, user_info)
+        claude_prompt = analyzer.generate_claude_analysis_prompt(analyses, user_info, aggregate, human_analysis)
         claude_prompt_file = 'claude_analysis_prompt.md'
-        with open(claude_prompt_file, 'w', encoding='utf-8') as f:
-            f.write(claude_prompt)
+        write_output(claude_prompt_file, claude_prompt)
         
         print(f"🤖 Claude Code分析用プロンプトを {claude_prompt_file} に保存しました")
         print("\n" + "="*80)
@@ -1197,12 +1893,15 @@ def main():
         print("3. Claude Codeが `detailed_analysis_report.md` を生成します")
         print("="*80)
         
-    except requests.exceptions.RequestException as e:
+    except HTTP_ERRORS as e:
         print(f"❌ GitHub API エラー: {e}")
         sys.exit(1)
     except Exception as e:
         print(f"❌ エラーが発生しました: {e}")
         sys.exit(1)
+    finally:
+        if analyzer is not None:
+            analyzer.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+"""GitHubAnalyzer のパス判定・リポジトリ分析のテスト（HTTPセッションはスタブ）"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from github_analyzer import GitHubAnalyzer  # noqa: E402
+
+API = 'https://api.github.com'
+TREE_PATHS = ['README.md', 'Dockerfile', 'package.json', 'src/__tests__/app.test.js']
+PACKAGE_JSON = '{"dependencies": {"react": "18", "express": "4"}}'
+BLOBS = {'package.json': PACKAGE_JSON, 'Dockerfile': 'FROM node:20'}
+
+
+def make_response(status: int, body=b'', headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+    response.headers = CaseInsensitiveDict(headers or {})
+    return response
+
+
+class StubSession:
+    """GitHub REST API の一部を返すスタブ"""
+
+    def __init__(self):
+        self.headers = {}
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        repo_api = f'{API}/repos/me/app'
+        if url == f'{repo_api}/languages':
+            return make_response(200, {'JavaScript': 900, 'CSS': 100})
+        if url.startswith(f'{repo_api}/git/trees/'):
+            tree = [{'path': path, 'type': 'blob', 'sha': path} for path in TREE_PATHS]
+            return make_response(200, {'tree': tree, 'truncated': False})
+        if url.startswith(f'{repo_api}/git/blobs/'):
+            sha = url.rsplit('/', 1)[1]
+            if sha in BLOBS:
+                return make_response(200, BLOBS[sha].encode())
+        if url == f'{repo_api}/commits':
+            link = f'<{repo_api}/commits?per_page=1&page=42>; rel="last"'
+            return make_response(200, [{}], {'Link': link})
+        return make_response(404, {'message': 'Not Found'})
+
+    def head(self, url, **kwargs):
+        return make_response(200)
+
+    def close(self):
+        pass
+
+
+REPO = {
+    'name': 'app',
+    'owner': {'login': 'me'},
+    'description': 'demo',
+    'language': 'JavaScript',
+    'size': 120,
+    'stargazers_count': 3,
+    'forks_count': 1,
+    'created_at': '2024-01-01T00:00:00Z',
+    'updated_at': '2024-06-01T00:00:00Z',
+    'pushed_at': '2024-06-01T00:00:00Z',
+    'topics': [],
+    'default_branch': 'main',
+}
+
+
+class GitHubAnalyzerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = StubSession()
+        with mock.patch.object(GitHubAnalyzer, '_create_session', return_value=self.session):
+            self.analyzer = GitHubAnalyzer('token')
+        self.addCleanup(self.analyzer.close)
+
+    def test_analyze_tree_paths(self):
+        self.assertEqual(
+            self.analyzer._analyze_tree_paths(TREE_PATHS),
+            {'readme_exists': True, 'has_ci': True, 'has_tests': True}
+        )
+        self.assertTrue(self.analyzer._analyze_tree_paths(['dockerfile'])['has_ci'])
+        self.assertEqual(
+            self.analyzer._analyze_tree_paths(['docs/README.md', 'src/main.py']),
+            {'readme_exists': False, 'has_ci': False, 'has_tests': False}
+        )
+
+    def test_analyze_repository_with_bundle(self):
+        bundle = {
+            'languages': {'JavaScript': 900},
+            'commit_count': 42,
+            'paths': ['README.md'],
+            'files': {'package.json': PACKAGE_JSON}
+        }
+        analysis = self.analyzer.analyze_repository_tech_stack(REPO, bundle)
+
+        self.assertEqual(analysis['languages'], {'JavaScript': 900})
+        self.assertEqual(analysis['commit_count'], 42)
+        self.assertEqual(analysis['frameworks'], ['React', 'Node.js Backend'])
+        # README・テスト・CIは再帰ツリーのパスで判定
+        self.assertTrue(analysis['readme_exists'])
+        self.assertTrue(analysis['has_tests'])
+        self.assertTrue(analysis['has_ci'])
+        self.assertEqual(analysis['stars'], 3)
+
+    def test_analyze_repository_with_rest(self):
+        analysis = self.analyzer.analyze_repository_tech_stack(REPO)
+
+        self.assertEqual(analysis['languages'], {'JavaScript': 900, 'CSS': 100})
+        self.assertEqual(analysis['commit_count'], 42)
+        self.assertEqual(analysis['frameworks'], ['React', 'Node.js Backend'])
+        self.assertEqual(analysis['tools'], ['npm/yarn', 'Docker'])
+        self.assertTrue(analysis['readme_exists'])
+        self.assertTrue(analysis['has_tests'])
+        self.assertTrue(analysis['has_ci'])
+
+
+if __name__ == '__main__':
+    unittest.main()